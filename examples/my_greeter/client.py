@@ -9,6 +9,16 @@ import httpx
 
 _LOGGER = logging.getLogger("client")
 
+_HTTPX_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+
+def make_httpx_client(host: str, port: int) -> httpx.Client:
+    return httpx.Client(base_url=f"http://{host}:{port}", limits=_HTTPX_LIMITS)
+
+
+def make_httpx_async_client(host: str, port: int) -> httpx.AsyncClient:
+    return httpx.AsyncClient(base_url=f"http://{host}:{port}", limits=_HTTPX_LIMITS)
+
 
 def run_client_httpx_sync(host: str, port: int) -> None:
     from api.fastapi.client import GreeterClient, StructureClient, UsersClient
@@ -20,7 +30,7 @@ def run_client_httpx_sync(host: str, port: int) -> None:
         UsersFindInfoByNameRequest,
     )
 
-    with httpx.Client(base_url=f"http://{host}:{port}") as client:
+    with make_httpx_client(host, port) as client:
         greeter = GreeterClient(client)
 
         _LOGGER.debug("unary unary request")
@@ -57,7 +67,7 @@ async def run_client_httpx_async(host: str, port: int) -> None:
         UsersFindInfoByNameRequest,
     )
 
-    async with httpx.AsyncClient(base_url=f"http://{host}:{port}") as client:
+    async with make_httpx_async_client(host, port) as client:
         greeter = GreeterAsyncClient(client)
 
         _LOGGER.debug("unary unary request")
@@ -84,6 +94,19 @@ async def run_client_httpx_async(host: str, port: int) -> None:
         _LOGGER.info(struct.payload)
 
 
+def make_aiohttp_session(host: str, port: int) -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        base_url=f"http://{host}:{port}",
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=30,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=30.0,
+        ),
+    )
+
+
 async def run_client_aiohttp(host: str, port: int) -> None:
     from api.aiohttp.client import GreeterClient, StructureClient, UsersClient
     from api.aiohttp.model import (
@@ -94,7 +117,7 @@ async def run_client_aiohttp(host: str, port: int) -> None:
         UsersFindInfoByNameRequest,
     )
 
-    async with aiohttp.ClientSession(base_url=f"http://{host}:{port}") as session:
+    async with make_aiohttp_session(host, port) as session:
         greeter = GreeterClient(session)
 
         _LOGGER.debug("unary unary request")
@@ -2,6 +2,8 @@ import aiohttp
 import api.aiohttp.model
 import asyncio
 import typing
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+_WS_CLOSE_MSG_TYPES = frozenset((aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSE))
 
 class StructureClient:
 
@@ -9,22 +11,51 @@ class StructureClient:
         self.__session = session
 
     async def complex(self, request: api.aiohttp.model.StructureComplexRequest) -> api.aiohttp.model.StructureComplexResponse:
-        async with self.__session.post(url='/structure/complex', json=request.model_dump(mode='json', by_alias=True, exclude_none=True)) as raw_response:
-            response = api.aiohttp.model.StructureComplexResponse.model_validate_json(await raw_response.read())
+        async with self.__session.post(url='/structure/complex', data=api.aiohttp.model.STRUCTURE_COMPLEX_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS) as raw_response:
+            response = api.aiohttp.model.STRUCTURE_COMPLEX_RESPONSE_ADAPTER.validate_json(await raw_response.read())
             return response
 
+    async def count_users(self, request: api.aiohttp.model.StructureCountUsersRequest) -> api.aiohttp.model.StructureCountUsersResponse:
+        async with self.__session.post(url='/structure/count_users', data=api.aiohttp.model.STRUCTURE_COUNT_USERS_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS) as raw_response:
+            response = api.aiohttp.model.STRUCTURE_COUNT_USERS_RESPONSE_ADAPTER.validate_json(await raw_response.read())
+            return response
+
+    async def stream_user_names(self, requests: typing.AsyncIterable[api.aiohttp.model.StructureStreamUserNamesRequest]) -> typing.AsyncIterator[api.aiohttp.model.StructureStreamUserNamesResponse]:
+
+        async def send_requests(ws: aiohttp.ClientWebSocketResponse) -> None:
+            try:
+                async for request in requests:
+                    await ws.send_bytes(api.aiohttp.model.STRUCTURE_STREAM_USER_NAMES_REQUEST_ADAPTER.dump_json(request, by_alias=True))
+            finally:
+                await ws.close()
+        async with self.__session.ws_connect(url='/structure/stream_user_names') as ws:
+            sender = asyncio.create_task(send_requests(ws))
+            try:
+                while not ws.closed:
+                    msg = await ws.receive()
+                    if ws.closed:
+                        break
+                    if msg.type in _WS_CLOSE_MSG_TYPES:
+                        continue
+                    if msg.type is aiohttp.WSMsgType.ERROR:
+                        raise msg.data
+                    response = api.aiohttp.model.STRUCTURE_STREAM_USER_NAMES_RESPONSE_ADAPTER.validate_json(msg.data)
+                    yield response
+            finally:
+                await sender
+
 class GreeterClient:
 
     def __init__(self, session: aiohttp.ClientSession) -> None:
         self.__session = session
 
     async def greet(self, request: api.aiohttp.model.GreeterGreetRequest) -> api.aiohttp.model.GreeterGreetResponse:
-        async with self.__session.post(url='/greeter/greet', json=request.model_dump(mode='json', by_alias=True, exclude_none=True)) as raw_response:
-            response = api.aiohttp.model.GreeterGreetResponse.model_validate_json(await raw_response.read())
+        async with self.__session.post(url='/greeter/greet', data=api.aiohttp.model.GREETER_GREET_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS) as raw_response:
+            response = api.aiohttp.model.GREETER_GREET_RESPONSE_ADAPTER.validate_json(await raw_response.read())
             return response
 
     async def notify_greeted(self, request: api.aiohttp.model.GreeterNotifyGreetedRequest) -> None:
-        async with self.__session.post(url='/greeter/notify_greeted', json=request.model_dump(mode='json', by_alias=True, exclude_none=True)) as raw_response:
+        async with self.__session.post(url='/greeter/notify_greeted', data=api.aiohttp.model.GREETER_NOTIFY_GREETED_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS) as raw_response:
             pass
 
     async def stream_greetings(self, requests: typing.AsyncIterable[api.aiohttp.model.GreeterStreamGreetingsRequest]) -> typing.AsyncIterator[api.aiohttp.model.GreeterStreamGreetingsResponse]:
@@ -32,7 +63,7 @@ class GreeterClient:
         async def send_requests(ws: aiohttp.ClientWebSocketResponse) -> None:
             try:
                 async for request in requests:
-                    await ws.send_json(request.model_dump(mode='json', by_alias=True, exclude_none=True))
+                    await ws.send_bytes(api.aiohttp.model.GREETER_STREAM_GREETINGS_REQUEST_ADAPTER.dump_json(request, by_alias=True))
             finally:
                 await ws.close()
         async with self.__session.ws_connect(url='/greeter/stream_greetings') as ws:
@@ -42,11 +73,11 @@ class GreeterClient:
                     msg = await ws.receive()
                     if ws.closed:
                         break
-                    if msg.type in {aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSE}:
+                    if msg.type in _WS_CLOSE_MSG_TYPES:
                         continue
                     if msg.type is aiohttp.WSMsgType.ERROR:
                         raise msg.data
-                    response = api.aiohttp.model.GreeterStreamGreetingsResponse.model_validate_json(msg.data)
+                    response = api.aiohttp.model.GREETER_STREAM_GREETINGS_RESPONSE_ADAPTER.validate_json(msg.data)
                     yield response
             finally:
                 await sender
@@ -57,16 +88,16 @@ class UsersClient:
         self.__session = session
 
     async def find_by_name(self, request: api.aiohttp.model.UsersFindByNameRequest) -> api.aiohttp.model.UsersFindByNameResponse:
-        async with self.__session.post(url='/users/find_by_name', json=request.model_dump(mode='json', by_alias=True, exclude_none=True)) as raw_response:
-            response = api.aiohttp.model.UsersFindByNameResponse.model_validate_json(await raw_response.read())
+        async with self.__session.post(url='/users/find_by_name', data=api.aiohttp.model.USERS_FIND_BY_NAME_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS) as raw_response:
+            response = api.aiohttp.model.USERS_FIND_BY_NAME_RESPONSE_ADAPTER.validate_json(await raw_response.read())
             return response
 
     async def find_info_by_name(self, request: api.aiohttp.model.UsersFindInfoByNameRequest) -> api.aiohttp.model.UsersFindInfoByNameResponse:
-        async with self.__session.post(url='/users/find_info_by_name', json=request.model_dump(mode='json', by_alias=True, exclude_none=True)) as raw_response:
-            response = api.aiohttp.model.UsersFindInfoByNameResponse.model_validate_json(await raw_response.read())
+        async with self.__session.post(url='/users/find_info_by_name', data=api.aiohttp.model.USERS_FIND_INFO_BY_NAME_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS) as raw_response:
+            response = api.aiohttp.model.USERS_FIND_INFO_BY_NAME_RESPONSE_ADAPTER.validate_json(await raw_response.read())
             return response
 
     async def register(self, request: api.aiohttp.model.UsersRegisterRequest) -> api.aiohttp.model.UsersRegisterResponse:
-        async with self.__session.post(url='/users/register', json=request.model_dump(mode='json', by_alias=True, exclude_none=True)) as raw_response:
-            response = api.aiohttp.model.UsersRegisterResponse.model_validate_json(await raw_response.read())
+        async with self.__session.post(url='/users/register', data=api.aiohttp.model.USERS_REGISTER_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS) as raw_response:
+            response = api.aiohttp.model.USERS_REGISTER_RESPONSE_ADAPTER.validate_json(await raw_response.read())
             return response
\ No newline at end of file
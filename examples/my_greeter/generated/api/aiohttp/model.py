@@ -4,6 +4,7 @@ import typing
 
 class StructureComplexRequest(pydantic.BaseModel):
     """Request DTO for :class:`my_service.core.structure.StructureController` :meth:`complex` entrypoint method."""
+STRUCTURE_COMPLEX_REQUEST_ADAPTER = pydantic.TypeAdapter(StructureComplexRequest)
 
 class UserInfo(pydantic.BaseModel):
     """DTO for :class:`my_service.core.greeter.model.UserInfo` type."""
@@ -21,39 +22,68 @@ class ComplexStructure(pydantic.BaseModel):
 class StructureComplexResponse(pydantic.BaseModel):
     """Response DTO for :class:`my_service.core.structure.StructureController` :meth:`complex` entrypoint method."""
     payload: typing.Sequence[ComplexStructure]
+STRUCTURE_COMPLEX_RESPONSE_ADAPTER = pydantic.TypeAdapter(StructureComplexResponse)
+
+class StructureCountUsersRequest(pydantic.BaseModel):
+    """Request DTO for :class:`my_service.core.structure.StructureController` :meth:`count_users` entrypoint method."""
+    users: typing.Sequence[UserInfo]
+STRUCTURE_COUNT_USERS_REQUEST_ADAPTER = pydantic.TypeAdapter(StructureCountUsersRequest)
+
+class StructureCountUsersResponse(pydantic.BaseModel):
+    """Response DTO for :class:`my_service.core.structure.StructureController` :meth:`count_users` entrypoint method."""
+    payload: builtins.int
+STRUCTURE_COUNT_USERS_RESPONSE_ADAPTER = pydantic.TypeAdapter(StructureCountUsersResponse)
+
+class StructureStreamUserNamesRequest(pydantic.BaseModel):
+    """Request DTO for :class:`my_service.core.structure.StructureController` :meth:`stream_user_names` entrypoint method."""
+    users: UserInfo
+STRUCTURE_STREAM_USER_NAMES_REQUEST_ADAPTER = pydantic.TypeAdapter(StructureStreamUserNamesRequest)
+
+class StructureStreamUserNamesResponse(pydantic.BaseModel):
+    """Response DTO for :class:`my_service.core.structure.StructureController` :meth:`stream_user_names` entrypoint method."""
+    payload: builtins.str
+STRUCTURE_STREAM_USER_NAMES_RESPONSE_ADAPTER = pydantic.TypeAdapter(StructureStreamUserNamesResponse)
 
 class GreeterGreetRequest(pydantic.BaseModel):
     """Request DTO for :class:`my_service.core.greeter.greeter.Greeter` :meth:`greet` entrypoint method."""
     user: UserInfo
+GREETER_GREET_REQUEST_ADAPTER = pydantic.TypeAdapter(GreeterGreetRequest)
 
 class GreeterGreetResponse(pydantic.BaseModel):
     """Response DTO for :class:`my_service.core.greeter.greeter.Greeter` :meth:`greet` entrypoint method."""
     payload: builtins.str
+GREETER_GREET_RESPONSE_ADAPTER = pydantic.TypeAdapter(GreeterGreetResponse)
 
 class GreeterNotifyGreetedRequest(pydantic.BaseModel):
     """Request DTO for :class:`my_service.core.greeter.greeter.Greeter` :meth:`notify_greeted` entrypoint method."""
     user: UserInfo
     message: builtins.str
+GREETER_NOTIFY_GREETED_REQUEST_ADAPTER = pydantic.TypeAdapter(GreeterNotifyGreetedRequest)
 
 class GreeterStreamGreetingsRequest(pydantic.BaseModel):
     """Request DTO for :class:`my_service.core.greeter.greeter.Greeter` :meth:`stream_greetings` entrypoint method."""
     users: UserInfo
+GREETER_STREAM_GREETINGS_REQUEST_ADAPTER = pydantic.TypeAdapter(GreeterStreamGreetingsRequest)
 
 class GreeterStreamGreetingsResponse(pydantic.BaseModel):
     """Response DTO for :class:`my_service.core.greeter.greeter.Greeter` :meth:`stream_greetings` entrypoint method."""
     payload: builtins.str
+GREETER_STREAM_GREETINGS_RESPONSE_ADAPTER = pydantic.TypeAdapter(GreeterStreamGreetingsResponse)
 
 class UsersFindByNameRequest(pydantic.BaseModel):
     """Request DTO for :class:`my_service.core.greeter.greeter.UserManager` :meth:`find_by_name` entrypoint method."""
     name: builtins.str
+USERS_FIND_BY_NAME_REQUEST_ADAPTER = pydantic.TypeAdapter(UsersFindByNameRequest)
 
 class UsersFindByNameResponse(pydantic.BaseModel):
     """Response DTO for :class:`my_service.core.greeter.greeter.UserManager` :meth:`find_by_name` entrypoint method."""
     payload: typing.Union[UserInfo, None]
+USERS_FIND_BY_NAME_RESPONSE_ADAPTER = pydantic.TypeAdapter(UsersFindByNameResponse)
 
 class UsersFindInfoByNameRequest(pydantic.BaseModel):
     """Request DTO for :class:`my_service.core.greeter.greeter.UserManager` :meth:`find_info_by_name` entrypoint method."""
     name: builtins.str
+USERS_FIND_INFO_BY_NAME_REQUEST_ADAPTER = pydantic.TypeAdapter(UsersFindInfoByNameRequest)
 
 class SystemInfo(pydantic.BaseModel):
     """DTO for :class:`my_service.core.greeter.model.SystemInfo` type."""
@@ -63,11 +93,14 @@ class SystemInfo(pydantic.BaseModel):
 class UsersFindInfoByNameResponse(pydantic.BaseModel):
     """Response DTO for :class:`my_service.core.greeter.greeter.UserManager` :meth:`find_info_by_name` entrypoint method."""
     payload: typing.Union[UserInfo, SystemInfo, None]
+USERS_FIND_INFO_BY_NAME_RESPONSE_ADAPTER = pydantic.TypeAdapter(UsersFindInfoByNameResponse)
 
 class UsersRegisterRequest(pydantic.BaseModel):
     """Request DTO for :class:`my_service.core.greeter.greeter.UserManager` :meth:`register` entrypoint method."""
     name: builtins.str
+USERS_REGISTER_REQUEST_ADAPTER = pydantic.TypeAdapter(UsersRegisterRequest)
 
 class UsersRegisterResponse(pydantic.BaseModel):
     """Response DTO for :class:`my_service.core.greeter.greeter.UserManager` :meth:`register` entrypoint method."""
-    payload: UserInfo
\ No newline at end of file
+    payload: UserInfo
+USERS_REGISTER_RESPONSE_ADAPTER = pydantic.TypeAdapter(UsersRegisterResponse)
\ No newline at end of file
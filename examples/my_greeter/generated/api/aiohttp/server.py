@@ -2,7 +2,6 @@ import aiohttp.web
 import api.aiohttp.model
 import asyncio
 import concurrent.futures
-import functools
 import my_service.core.greeter.greeter
 import my_service.core.greeter.model
 import my_service.core.structure
@@ -15,14 +14,36 @@ class StructureHandler:
         self.__executor = executor
 
     async def complex(self, raw_request: aiohttp.web.Request) -> aiohttp.web.Response:
-        request = api.aiohttp.model.StructureComplexRequest.model_validate_json(await raw_request.read())
+        request = api.aiohttp.model.STRUCTURE_COMPLEX_REQUEST_ADAPTER.validate_json(await raw_request.read())
         output = await self.__impl.complex()
-        response = api.aiohttp.model.StructureComplexResponse(payload=[api.aiohttp.model.ComplexStructure(items={output_item_items_key: api.aiohttp.model.Item(users=[api.aiohttp.model.UserInfo(id_=output_item_items_value_users_item.id_, name=output_item_items_value_users_item.name) for output_item_items_value_users_item in output_item_items_value.users]) for output_item_items_key, output_item_items_value in output_item.items.items()}) for output_item in output])
-        return aiohttp.web.json_response(data=response.model_dump(mode='json', by_alias=True, exclude_none=True))
+        response = api.aiohttp.model.StructureComplexResponse.model_construct(payload=[api.aiohttp.model.ComplexStructure(items={output_item_items_key: api.aiohttp.model.Item(users=[api.aiohttp.model.UserInfo(id_=output_item_items_value_users_item.id_, name=output_item_items_value_users_item.name) for output_item_items_value_users_item in output_item_items_value.users]) for output_item_items_key, output_item_items_value in output_item.items.items()}) for output_item in output])
+        return aiohttp.web.Response(body=api.aiohttp.model.STRUCTURE_COMPLEX_RESPONSE_ADAPTER.dump_json(response, by_alias=True), content_type='application/json')
+
+    async def count_users(self, raw_request: aiohttp.web.Request) -> aiohttp.web.Response:
+        request = api.aiohttp.model.STRUCTURE_COUNT_USERS_REQUEST_ADAPTER.validate_json(await raw_request.read())
+        input_users = [my_service.core.greeter.model.UserInfo(request_users_item.id_, request_users_item.name) for request_users_item in request.users]
+        output = await self.__impl.count_users(users=input_users)
+        response = api.aiohttp.model.StructureCountUsersResponse.model_construct(payload=output)
+        return aiohttp.web.Response(body=api.aiohttp.model.STRUCTURE_COUNT_USERS_RESPONSE_ADAPTER.dump_json(response, by_alias=True), content_type='application/json')
+
+    async def stream_user_names(self, raw_request: aiohttp.web.Request) -> aiohttp.web.WebSocketResponse:
+        websocket = aiohttp.web.WebSocketResponse()
+
+        async def receive_inputs() -> typing.AsyncIterator[my_service.core.greeter.model.UserInfo]:
+            async for msg in websocket:
+                request = api.aiohttp.model.STRUCTURE_STREAM_USER_NAMES_REQUEST_ADAPTER.validate_json(msg.data)
+                yield my_service.core.greeter.model.UserInfo(request.users.id_, request.users.name)
+        await websocket.prepare(raw_request)
+        async for output in self.__impl.stream_user_names(receive_inputs()):
+            response = api.aiohttp.model.StructureStreamUserNamesResponse.model_construct(payload=output)
+            await websocket.send_bytes(api.aiohttp.model.STRUCTURE_STREAM_USER_NAMES_RESPONSE_ADAPTER.dump_json(response, by_alias=True))
+        return websocket
 
 def add_structure_subapp(app: aiohttp.web.Application, handler: StructureHandler) -> None:
     sub = aiohttp.web.Application()
     sub.router.add_post(path='/complex', handler=handler.complex)
+    sub.router.add_post(path='/count_users', handler=handler.count_users)
+    sub.router.add_get(path='/stream_user_names', handler=handler.stream_user_names)
     app.add_subapp(prefix='/structure', subapp=sub)
 
 class GreeterHandler:
@@ -32,30 +53,30 @@ class GreeterHandler:
         self.__executor = executor
 
     async def greet(self, raw_request: aiohttp.web.Request) -> aiohttp.web.Response:
-        request = api.aiohttp.model.GreeterGreetRequest.model_validate_json(await raw_request.read())
-        input_user = my_service.core.greeter.model.UserInfo(id_=request.user.id_, name=request.user.name)
-        output = await asyncio.get_running_loop().run_in_executor(self.__executor, functools.partial(self.__impl.greet, user=input_user))
-        response = api.aiohttp.model.GreeterGreetResponse(payload=output)
-        return aiohttp.web.json_response(data=response.model_dump(mode='json', by_alias=True, exclude_none=True))
+        request = api.aiohttp.model.GREETER_GREET_REQUEST_ADAPTER.validate_json(await raw_request.read())
+        input_user = my_service.core.greeter.model.UserInfo(request.user.id_, request.user.name)
+        output = await asyncio.get_running_loop().run_in_executor(self.__executor, self.__impl.greet, input_user)
+        response = api.aiohttp.model.GreeterGreetResponse.model_construct(payload=output)
+        return aiohttp.web.Response(body=api.aiohttp.model.GREETER_GREET_RESPONSE_ADAPTER.dump_json(response, by_alias=True), content_type='application/json')
 
     async def notify_greeted(self, raw_request: aiohttp.web.Request) -> aiohttp.web.Response:
-        request = api.aiohttp.model.GreeterNotifyGreetedRequest.model_validate_json(await raw_request.read())
-        input_user = my_service.core.greeter.model.UserInfo(id_=request.user.id_, name=request.user.name)
+        request = api.aiohttp.model.GREETER_NOTIFY_GREETED_REQUEST_ADAPTER.validate_json(await raw_request.read())
+        input_user = my_service.core.greeter.model.UserInfo(request.user.id_, request.user.name)
         input_message = request.message
-        await asyncio.get_running_loop().run_in_executor(self.__executor, functools.partial(self.__impl.notify_greeted, user=input_user, message=input_message))
-        return aiohttp.web.json_response()
+        await asyncio.get_running_loop().run_in_executor(self.__executor, self.__impl.notify_greeted, input_user, input_message)
+        return aiohttp.web.Response(content_type='application/json')
 
     async def stream_greetings(self, raw_request: aiohttp.web.Request) -> aiohttp.web.WebSocketResponse:
         websocket = aiohttp.web.WebSocketResponse()
 
         async def receive_inputs() -> typing.AsyncIterator[my_service.core.greeter.model.UserInfo]:
             async for msg in websocket:
-                request = api.aiohttp.model.GreeterStreamGreetingsRequest.model_validate_json(msg.data)
-                yield my_service.core.greeter.model.UserInfo(id_=request.users.id_, name=request.users.name)
+                request = api.aiohttp.model.GREETER_STREAM_GREETINGS_REQUEST_ADAPTER.validate_json(msg.data)
+                yield my_service.core.greeter.model.UserInfo(request.users.id_, request.users.name)
         await websocket.prepare(raw_request)
         async for output in self.__impl.stream_greetings(receive_inputs()):
-            response = api.aiohttp.model.GreeterStreamGreetingsResponse(payload=output)
-            await websocket.send_str(response.model_dump_json(by_alias=True, exclude_none=True))
+            response = api.aiohttp.model.GreeterStreamGreetingsResponse.model_construct(payload=output)
+            await websocket.send_bytes(api.aiohttp.model.GREETER_STREAM_GREETINGS_RESPONSE_ADAPTER.dump_json(response, by_alias=True))
         return websocket
 
 def add_greeter_subapp(app: aiohttp.web.Application, handler: GreeterHandler) -> None:
@@ -72,25 +93,25 @@ class UsersHandler:
         self.__executor = executor
 
     async def find_by_name(self, raw_request: aiohttp.web.Request) -> aiohttp.web.Response:
-        request = api.aiohttp.model.UsersFindByNameRequest.model_validate_json(await raw_request.read())
+        request = api.aiohttp.model.USERS_FIND_BY_NAME_REQUEST_ADAPTER.validate_json(await raw_request.read())
         input_name = request.name
         output = await self.__impl.find_by_name(name=input_name)
-        response = api.aiohttp.model.UsersFindByNameResponse(payload=api.aiohttp.model.UserInfo(id_=output.id_, name=output.name) if isinstance(output, my_service.core.greeter.model.UserInfo) else None)
-        return aiohttp.web.json_response(data=response.model_dump(mode='json', by_alias=True, exclude_none=True))
+        response = api.aiohttp.model.UsersFindByNameResponse.model_construct(payload=api.aiohttp.model.UserInfo(id_=output.id_, name=output.name) if isinstance(output, my_service.core.greeter.model.UserInfo) else None)
+        return aiohttp.web.Response(body=api.aiohttp.model.USERS_FIND_BY_NAME_RESPONSE_ADAPTER.dump_json(response, by_alias=True), content_type='application/json')
 
     async def find_info_by_name(self, raw_request: aiohttp.web.Request) -> aiohttp.web.Response:
-        request = api.aiohttp.model.UsersFindInfoByNameRequest.model_validate_json(await raw_request.read())
+        request = api.aiohttp.model.USERS_FIND_INFO_BY_NAME_REQUEST_ADAPTER.validate_json(await raw_request.read())
         input_name = request.name
         output = await self.__impl.find_info_by_name(name=input_name)
-        response = api.aiohttp.model.UsersFindInfoByNameResponse(payload=api.aiohttp.model.UserInfo(id_=output.id_, name=output.name) if isinstance(output, my_service.core.greeter.model.UserInfo) else api.aiohttp.model.SystemInfo(name=output.name, index=output.index) if isinstance(output, my_service.core.greeter.model.SystemInfo) else None)
-        return aiohttp.web.json_response(data=response.model_dump(mode='json', by_alias=True, exclude_none=True))
+        response = api.aiohttp.model.UsersFindInfoByNameResponse.model_construct(payload=api.aiohttp.model.UserInfo(id_=output.id_, name=output.name) if isinstance(output, my_service.core.greeter.model.UserInfo) else api.aiohttp.model.SystemInfo(name=output.name, index=output.index) if isinstance(output, my_service.core.greeter.model.SystemInfo) else None)
+        return aiohttp.web.Response(body=api.aiohttp.model.USERS_FIND_INFO_BY_NAME_RESPONSE_ADAPTER.dump_json(response, by_alias=True), content_type='application/json')
 
     async def register(self, raw_request: aiohttp.web.Request) -> aiohttp.web.Response:
-        request = api.aiohttp.model.UsersRegisterRequest.model_validate_json(await raw_request.read())
+        request = api.aiohttp.model.USERS_REGISTER_REQUEST_ADAPTER.validate_json(await raw_request.read())
         input_name = request.name
         output = await self.__impl.register(name=input_name)
-        response = api.aiohttp.model.UsersRegisterResponse(payload=api.aiohttp.model.UserInfo(id_=output.id_, name=output.name))
-        return aiohttp.web.json_response(data=response.model_dump(mode='json', by_alias=True, exclude_none=True))
+        response = api.aiohttp.model.UsersRegisterResponse.model_construct(payload=api.aiohttp.model.UserInfo(id_=output.id_, name=output.name))
+        return aiohttp.web.Response(body=api.aiohttp.model.USERS_REGISTER_RESPONSE_ADAPTER.dump_json(response, by_alias=True), content_type='application/json')
 
 def add_users_subapp(app: aiohttp.web.Application, handler: UsersHandler) -> None:
     sub = aiohttp.web.Application()
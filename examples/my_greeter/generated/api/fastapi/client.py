@@ -6,48 +6,113 @@ import httpx_ws
 import queue
 import threading
 import typing
+_JSON_HEADERS = {'Content-Type': 'application/json'}
 
 class StructureClient:
 
     def __init__(self, impl: httpx.Client) -> None:
         self.__impl = impl
+        self.__post = impl.post
 
     def complex(self, request: api.fastapi.model.StructureComplexRequest) -> api.fastapi.model.StructureComplexResponse:
-        raw_response = self.__impl.post(url='/structure/complex', json=request.model_dump(mode='json', by_alias=True, exclude_none=True))
-        response = api.fastapi.model.StructureComplexResponse.model_validate_json(raw_response.read())
+        raw_response = self.__post(url='/structure/complex', content=api.fastapi.model.STRUCTURE_COMPLEX_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
+        response = api.fastapi.model.STRUCTURE_COMPLEX_RESPONSE_ADAPTER.validate_json(raw_response.content)
         return response
 
+    def count_users(self, request: api.fastapi.model.StructureCountUsersRequest) -> api.fastapi.model.StructureCountUsersResponse:
+        raw_response = self.__post(url='/structure/count_users', content=api.fastapi.model.STRUCTURE_COUNT_USERS_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
+        response = api.fastapi.model.STRUCTURE_COUNT_USERS_RESPONSE_ADAPTER.validate_json(raw_response.content)
+        return response
+
+    def stream_user_names(self, requests: typing.Iterable[api.fastapi.model.StructureStreamUserNamesRequest], receive_timeout: typing.Optional[builtins.float]=None) -> typing.Iterator[api.fastapi.model.StructureStreamUserNamesResponse]:
+        done = threading.Event()
+
+        def send_requests(ws: httpx_ws.WebSocketSession) -> None:
+            try:
+                for request in requests:
+                    ws.send_bytes(api.fastapi.model.STRUCTURE_STREAM_USER_NAMES_REQUEST_ADAPTER.dump_json(request, by_alias=True))
+            finally:
+                done.set()
+                ws.close()
+        with httpx_ws.connect_ws(url='/structure/stream_user_names', client=self.__impl) as ws:
+            sender = threading.Thread(target=send_requests, args=(ws,), daemon=True)
+            sender.start()
+            while not done.is_set():
+                try:
+                    raw_response = ws.receive_bytes(timeout=receive_timeout)
+                except queue.Empty:
+                    continue
+                except (httpx_ws.WebSocketNetworkError, httpx_ws.WebSocketDisconnect) as err:
+                    if done.is_set():
+                        break
+                    raise err
+                else:
+                    response = api.fastapi.model.STRUCTURE_STREAM_USER_NAMES_RESPONSE_ADAPTER.validate_json(raw_response)
+                    yield response
+
 class StructureAsyncClient:
 
     def __init__(self, impl: httpx.AsyncClient) -> None:
         self.__impl = impl
+        self.__post = impl.post
 
     async def complex(self, request: api.fastapi.model.StructureComplexRequest) -> api.fastapi.model.StructureComplexResponse:
-        raw_response = await self.__impl.post(url='/structure/complex', json=request.model_dump(mode='json', by_alias=True, exclude_none=True))
-        response = api.fastapi.model.StructureComplexResponse.model_validate_json(raw_response.read())
+        raw_response = await self.__post(url='/structure/complex', content=api.fastapi.model.STRUCTURE_COMPLEX_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
+        response = api.fastapi.model.STRUCTURE_COMPLEX_RESPONSE_ADAPTER.validate_json(raw_response.content)
         return response
 
+    async def count_users(self, request: api.fastapi.model.StructureCountUsersRequest) -> api.fastapi.model.StructureCountUsersResponse:
+        raw_response = await self.__post(url='/structure/count_users', content=api.fastapi.model.STRUCTURE_COUNT_USERS_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
+        response = api.fastapi.model.STRUCTURE_COUNT_USERS_RESPONSE_ADAPTER.validate_json(raw_response.content)
+        return response
+
+    async def stream_user_names(self, requests: typing.AsyncIterable[api.fastapi.model.StructureStreamUserNamesRequest], receive_timeout: typing.Optional[builtins.float]=None) -> typing.AsyncIterator[api.fastapi.model.StructureStreamUserNamesResponse]:
+
+        async def send_requests(ws: httpx_ws.AsyncWebSocketSession) -> None:
+            try:
+                async for request in requests:
+                    await ws.send_bytes(api.fastapi.model.STRUCTURE_STREAM_USER_NAMES_REQUEST_ADAPTER.dump_json(request, by_alias=True))
+            finally:
+                await ws.close()
+        async with httpx_ws.aconnect_ws(url='/structure/stream_user_names', client=self.__impl) as ws:
+            sender = asyncio.create_task(send_requests(ws))
+            try:
+                while not sender.done():
+                    try:
+                        raw_response = await ws.receive_bytes(timeout=receive_timeout)
+                    except queue.Empty:
+                        continue
+                    except (httpx_ws.WebSocketNetworkError, httpx_ws.WebSocketDisconnect) as err:
+                        if sender.done():
+                            break
+                        raise err
+                    else:
+                        response = api.fastapi.model.STRUCTURE_STREAM_USER_NAMES_RESPONSE_ADAPTER.validate_json(raw_response)
+                        yield response
+            finally:
+                await sender
+
 class GreeterClient:
 
     def __init__(self, impl: httpx.Client) -> None:
         self.__impl = impl
+        self.__post = impl.post
 
     def greet(self, request: api.fastapi.model.GreeterGreetRequest) -> api.fastapi.model.GreeterGreetResponse:
-        raw_response = self.__impl.post(url='/greeter/greet', json=request.model_dump(mode='json', by_alias=True, exclude_none=True))
-        response = api.fastapi.model.GreeterGreetResponse.model_validate_json(raw_response.read())
+        raw_response = self.__post(url='/greeter/greet', content=api.fastapi.model.GREETER_GREET_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
+        response = api.fastapi.model.GREETER_GREET_RESPONSE_ADAPTER.validate_json(raw_response.content)
         return response
 
     def notify_greeted(self, request: api.fastapi.model.GreeterNotifyGreetedRequest) -> None:
-        self.__impl.post(url='/greeter/notify_greeted', json=request.model_dump(mode='json', by_alias=True, exclude_none=True))
+        self.__post(url='/greeter/notify_greeted', content=api.fastapi.model.GREETER_NOTIFY_GREETED_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
 
     def stream_greetings(self, requests: typing.Iterable[api.fastapi.model.GreeterStreamGreetingsRequest], receive_timeout: typing.Optional[builtins.float]=None) -> typing.Iterator[api.fastapi.model.GreeterStreamGreetingsResponse]:
         done = threading.Event()
 
         def send_requests(ws: httpx_ws.WebSocketSession) -> None:
-            done.clear()
             try:
                 for request in requests:
-                    ws.send_text(request.model_dump_json(by_alias=True, exclude_none=True))
+                    ws.send_bytes(api.fastapi.model.GREETER_STREAM_GREETINGS_REQUEST_ADAPTER.dump_json(request, by_alias=True))
             finally:
                 done.set()
                 ws.close()
@@ -56,7 +121,7 @@ class GreeterClient:
             sender.start()
             while not done.is_set():
                 try:
-                    raw_response = ws.receive_text(timeout=receive_timeout)
+                    raw_response = ws.receive_bytes(timeout=receive_timeout)
                 except queue.Empty:
                     continue
                 except (httpx_ws.WebSocketNetworkError, httpx_ws.WebSocketDisconnect) as err:
@@ -64,28 +129,29 @@ class GreeterClient:
                         break
                     raise err
                 else:
-                    response = api.fastapi.model.GreeterStreamGreetingsResponse.model_validate_json(raw_response)
+                    response = api.fastapi.model.GREETER_STREAM_GREETINGS_RESPONSE_ADAPTER.validate_json(raw_response)
                     yield response
 
 class GreeterAsyncClient:
 
     def __init__(self, impl: httpx.AsyncClient) -> None:
         self.__impl = impl
+        self.__post = impl.post
 
     async def greet(self, request: api.fastapi.model.GreeterGreetRequest) -> api.fastapi.model.GreeterGreetResponse:
-        raw_response = await self.__impl.post(url='/greeter/greet', json=request.model_dump(mode='json', by_alias=True, exclude_none=True))
-        response = api.fastapi.model.GreeterGreetResponse.model_validate_json(raw_response.read())
+        raw_response = await self.__post(url='/greeter/greet', content=api.fastapi.model.GREETER_GREET_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
+        response = api.fastapi.model.GREETER_GREET_RESPONSE_ADAPTER.validate_json(raw_response.content)
         return response
 
     async def notify_greeted(self, request: api.fastapi.model.GreeterNotifyGreetedRequest) -> None:
-        await self.__impl.post(url='/greeter/notify_greeted', json=request.model_dump(mode='json', by_alias=True, exclude_none=True))
+        await self.__post(url='/greeter/notify_greeted', content=api.fastapi.model.GREETER_NOTIFY_GREETED_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
 
     async def stream_greetings(self, requests: typing.AsyncIterable[api.fastapi.model.GreeterStreamGreetingsRequest], receive_timeout: typing.Optional[builtins.float]=None) -> typing.AsyncIterator[api.fastapi.model.GreeterStreamGreetingsResponse]:
 
         async def send_requests(ws: httpx_ws.AsyncWebSocketSession) -> None:
             try:
                 async for request in requests:
-                    await ws.send_text(request.model_dump_json(by_alias=True, exclude_none=True))
+                    await ws.send_bytes(api.fastapi.model.GREETER_STREAM_GREETINGS_REQUEST_ADAPTER.dump_json(request, by_alias=True))
             finally:
                 await ws.close()
         async with httpx_ws.aconnect_ws(url='/greeter/stream_greetings', client=self.__impl) as ws:
@@ -93,7 +159,7 @@ class GreeterAsyncClient:
             try:
                 while not sender.done():
                     try:
-                        raw_response = await ws.receive_text(timeout=receive_timeout)
+                        raw_response = await ws.receive_bytes(timeout=receive_timeout)
                     except queue.Empty:
                         continue
                     except (httpx_ws.WebSocketNetworkError, httpx_ws.WebSocketDisconnect) as err:
@@ -101,7 +167,7 @@ class GreeterAsyncClient:
                             break
                         raise err
                     else:
-                        response = api.fastapi.model.GreeterStreamGreetingsResponse.model_validate_json(raw_response)
+                        response = api.fastapi.model.GREETER_STREAM_GREETINGS_RESPONSE_ADAPTER.validate_json(raw_response)
                         yield response
             finally:
                 await sender
@@ -110,38 +176,40 @@ class UsersClient:
 
     def __init__(self, impl: httpx.Client) -> None:
         self.__impl = impl
+        self.__post = impl.post
 
     def find_by_name(self, request: api.fastapi.model.UsersFindByNameRequest) -> api.fastapi.model.UsersFindByNameResponse:
-        raw_response = self.__impl.post(url='/users/find_by_name', json=request.model_dump(mode='json', by_alias=True, exclude_none=True))
-        response = api.fastapi.model.UsersFindByNameResponse.model_validate_json(raw_response.read())
+        raw_response = self.__post(url='/users/find_by_name', content=api.fastapi.model.USERS_FIND_BY_NAME_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
+        response = api.fastapi.model.USERS_FIND_BY_NAME_RESPONSE_ADAPTER.validate_json(raw_response.content)
         return response
 
     def find_info_by_name(self, request: api.fastapi.model.UsersFindInfoByNameRequest) -> api.fastapi.model.UsersFindInfoByNameResponse:
-        raw_response = self.__impl.post(url='/users/find_info_by_name', json=request.model_dump(mode='json', by_alias=True, exclude_none=True))
-        response = api.fastapi.model.UsersFindInfoByNameResponse.model_validate_json(raw_response.read())
+        raw_response = self.__post(url='/users/find_info_by_name', content=api.fastapi.model.USERS_FIND_INFO_BY_NAME_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
+        response = api.fastapi.model.USERS_FIND_INFO_BY_NAME_RESPONSE_ADAPTER.validate_json(raw_response.content)
         return response
 
     def register(self, request: api.fastapi.model.UsersRegisterRequest) -> api.fastapi.model.UsersRegisterResponse:
-        raw_response = self.__impl.post(url='/users/register', json=request.model_dump(mode='json', by_alias=True, exclude_none=True))
-        response = api.fastapi.model.UsersRegisterResponse.model_validate_json(raw_response.read())
+        raw_response = self.__post(url='/users/register', content=api.fastapi.model.USERS_REGISTER_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
+        response = api.fastapi.model.USERS_REGISTER_RESPONSE_ADAPTER.validate_json(raw_response.content)
         return response
 
 class UsersAsyncClient:
 
     def __init__(self, impl: httpx.AsyncClient) -> None:
         self.__impl = impl
+        self.__post = impl.post
 
     async def find_by_name(self, request: api.fastapi.model.UsersFindByNameRequest) -> api.fastapi.model.UsersFindByNameResponse:
-        raw_response = await self.__impl.post(url='/users/find_by_name', json=request.model_dump(mode='json', by_alias=True, exclude_none=True))
-        response = api.fastapi.model.UsersFindByNameResponse.model_validate_json(raw_response.read())
+        raw_response = await self.__post(url='/users/find_by_name', content=api.fastapi.model.USERS_FIND_BY_NAME_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
+        response = api.fastapi.model.USERS_FIND_BY_NAME_RESPONSE_ADAPTER.validate_json(raw_response.content)
         return response
 
     async def find_info_by_name(self, request: api.fastapi.model.UsersFindInfoByNameRequest) -> api.fastapi.model.UsersFindInfoByNameResponse:
-        raw_response = await self.__impl.post(url='/users/find_info_by_name', json=request.model_dump(mode='json', by_alias=True, exclude_none=True))
-        response = api.fastapi.model.UsersFindInfoByNameResponse.model_validate_json(raw_response.read())
+        raw_response = await self.__post(url='/users/find_info_by_name', content=api.fastapi.model.USERS_FIND_INFO_BY_NAME_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
+        response = api.fastapi.model.USERS_FIND_INFO_BY_NAME_RESPONSE_ADAPTER.validate_json(raw_response.content)
         return response
 
     async def register(self, request: api.fastapi.model.UsersRegisterRequest) -> api.fastapi.model.UsersRegisterResponse:
-        raw_response = await self.__impl.post(url='/users/register', json=request.model_dump(mode='json', by_alias=True, exclude_none=True))
-        response = api.fastapi.model.UsersRegisterResponse.model_validate_json(raw_response.read())
+        raw_response = await self.__post(url='/users/register', content=api.fastapi.model.USERS_REGISTER_REQUEST_ADAPTER.dump_json(request, by_alias=True), headers=_JSON_HEADERS)
+        response = api.fastapi.model.USERS_REGISTER_RESPONSE_ADAPTER.validate_json(raw_response.content)
         return response
\ No newline at end of file
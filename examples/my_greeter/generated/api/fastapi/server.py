@@ -10,14 +10,36 @@ class StructureHandler:
     def __init__(self, impl: my_service.core.structure.StructureController) -> None:
         self.__impl = impl
 
-    async def complex(self, request: api.fastapi.model.StructureComplexRequest) -> api.fastapi.model.StructureComplexResponse:
+    async def complex(self, request: api.fastapi.model.StructureComplexRequest) -> fastapi.Response:
         output = await self.__impl.complex()
-        response = api.fastapi.model.StructureComplexResponse(payload=[api.fastapi.model.ComplexStructure(items={output_item_items_key: api.fastapi.model.Item(users=[api.fastapi.model.UserInfo(id_=output_item_items_value_users_item.id_, name=output_item_items_value_users_item.name) for output_item_items_value_users_item in output_item_items_value.users]) for output_item_items_key, output_item_items_value in output_item.items.items()}) for output_item in output])
-        return response
+        response = api.fastapi.model.StructureComplexResponse.model_construct(payload=[api.fastapi.model.ComplexStructure(items={output_item_items_key: api.fastapi.model.Item(users=[api.fastapi.model.UserInfo(id_=output_item_items_value_users_item.id_, name=output_item_items_value_users_item.name) for output_item_items_value_users_item in output_item_items_value.users]) for output_item_items_key, output_item_items_value in output_item.items.items()}) for output_item in output])
+        return fastapi.Response(content=api.fastapi.model.STRUCTURE_COMPLEX_RESPONSE_ADAPTER.dump_json(response, by_alias=True), media_type='application/json')
+
+    async def count_users(self, request: api.fastapi.model.StructureCountUsersRequest) -> fastapi.Response:
+        input_users = [my_service.core.greeter.model.UserInfo(request_users_item.id_, request_users_item.name) for request_users_item in request.users]
+        output = await self.__impl.count_users(users=input_users)
+        response = api.fastapi.model.StructureCountUsersResponse.model_construct(payload=output)
+        return fastapi.Response(content=api.fastapi.model.STRUCTURE_COUNT_USERS_RESPONSE_ADAPTER.dump_json(response, by_alias=True), media_type='application/json')
+
+    async def stream_user_names(self, websocket: fastapi.WebSocket) -> None:
+
+        async def receive_inputs() -> typing.AsyncIterator[my_service.core.greeter.model.UserInfo]:
+            async for request_bytes in websocket.iter_bytes():
+                request = api.fastapi.model.STRUCTURE_STREAM_USER_NAMES_REQUEST_ADAPTER.validate_json(request_bytes)
+                yield my_service.core.greeter.model.UserInfo(request.users.id_, request.users.name)
+        try:
+            await websocket.accept()
+            async for output in self.__impl.stream_user_names(receive_inputs()):
+                response = api.fastapi.model.StructureStreamUserNamesResponse.model_construct(payload=output)
+                await websocket.send_bytes(api.fastapi.model.STRUCTURE_STREAM_USER_NAMES_RESPONSE_ADAPTER.dump_json(response, by_alias=True))
+        except fastapi.WebSocketDisconnect:
+            pass
 
 def create_structure_router(handler: StructureHandler) -> fastapi.APIRouter:
     router = fastapi.APIRouter(prefix='/structure', tags=['Structure'])
-    router.post(path='/complex', description=None)(handler.complex)
+    router.post(path='/complex', response_model=api.fastapi.model.StructureComplexResponse, description=None)(handler.complex)
+    router.post(path='/count_users', response_model=api.fastapi.model.StructureCountUsersResponse, description=None)(handler.count_users)
+    router.websocket(path='/stream_user_names')(handler.stream_user_names)
     return router
 
 class GreeterHandler:
@@ -25,35 +47,35 @@ class GreeterHandler:
     def __init__(self, impl: my_service.core.greeter.greeter.Greeter) -> None:
         self.__impl = impl
 
-    def greet(self, request: api.fastapi.model.GreeterGreetRequest) -> api.fastapi.model.GreeterGreetResponse:
-        input_user = my_service.core.greeter.model.UserInfo(id_=request.user.id_, name=request.user.name)
+    def greet(self, request: api.fastapi.model.GreeterGreetRequest) -> fastapi.Response:
+        input_user = my_service.core.greeter.model.UserInfo(request.user.id_, request.user.name)
         output = self.__impl.greet(user=input_user)
-        response = api.fastapi.model.GreeterGreetResponse(payload=output)
-        return response
+        response = api.fastapi.model.GreeterGreetResponse.model_construct(payload=output)
+        return fastapi.Response(content=api.fastapi.model.GREETER_GREET_RESPONSE_ADAPTER.dump_json(response, by_alias=True), media_type='application/json')
 
     def notify_greeted(self, request: api.fastapi.model.GreeterNotifyGreetedRequest) -> None:
-        input_user = my_service.core.greeter.model.UserInfo(id_=request.user.id_, name=request.user.name)
+        input_user = my_service.core.greeter.model.UserInfo(request.user.id_, request.user.name)
         input_message = request.message
         self.__impl.notify_greeted(user=input_user, message=input_message)
 
     async def stream_greetings(self, websocket: fastapi.WebSocket) -> None:
 
         async def receive_inputs() -> typing.AsyncIterator[my_service.core.greeter.model.UserInfo]:
-            async for request_text in websocket.iter_text():
-                request = api.fastapi.model.GreeterStreamGreetingsRequest.model_validate_json(request_text)
-                yield my_service.core.greeter.model.UserInfo(id_=request.users.id_, name=request.users.name)
+            async for request_bytes in websocket.iter_bytes():
+                request = api.fastapi.model.GREETER_STREAM_GREETINGS_REQUEST_ADAPTER.validate_json(request_bytes)
+                yield my_service.core.greeter.model.UserInfo(request.users.id_, request.users.name)
         try:
             await websocket.accept()
             async for output in self.__impl.stream_greetings(receive_inputs()):
-                response = api.fastapi.model.GreeterStreamGreetingsResponse(payload=output)
-                await websocket.send_text(response.model_dump_json(by_alias=True, exclude_none=True))
+                response = api.fastapi.model.GreeterStreamGreetingsResponse.model_construct(payload=output)
+                await websocket.send_bytes(api.fastapi.model.GREETER_STREAM_GREETINGS_RESPONSE_ADAPTER.dump_json(response, by_alias=True))
         except fastapi.WebSocketDisconnect:
             pass
 
 def create_greeter_router(handler: GreeterHandler) -> fastapi.APIRouter:
     router = fastapi.APIRouter(prefix='/greeter', tags=['Greeter'])
-    router.post(path='/greet', description='Make a greeting message for a user.')(handler.greet)
-    router.post(path='/notify_greeted', description=None)(handler.notify_greeted)
+    router.post(path='/greet', response_model=api.fastapi.model.GreeterGreetResponse, description='Make a greeting message for a user.')(handler.greet)
+    router.post(path='/notify_greeted', response_model=None, description=None)(handler.notify_greeted)
     router.websocket(path='/stream_greetings')(handler.stream_greetings)
     return router
 
@@ -62,27 +84,27 @@ class UsersHandler:
     def __init__(self, impl: my_service.core.greeter.greeter.UserManager) -> None:
         self.__impl = impl
 
-    async def find_by_name(self, request: api.fastapi.model.UsersFindByNameRequest) -> api.fastapi.model.UsersFindByNameResponse:
+    async def find_by_name(self, request: api.fastapi.model.UsersFindByNameRequest) -> fastapi.Response:
         input_name = request.name
         output = await self.__impl.find_by_name(name=input_name)
-        response = api.fastapi.model.UsersFindByNameResponse(payload=api.fastapi.model.UserInfo(id_=output.id_, name=output.name) if isinstance(output, my_service.core.greeter.model.UserInfo) else None)
-        return response
+        response = api.fastapi.model.UsersFindByNameResponse.model_construct(payload=api.fastapi.model.UserInfo(id_=output.id_, name=output.name) if isinstance(output, my_service.core.greeter.model.UserInfo) else None)
+        return fastapi.Response(content=api.fastapi.model.USERS_FIND_BY_NAME_RESPONSE_ADAPTER.dump_json(response, by_alias=True), media_type='application/json')
 
-    async def find_info_by_name(self, request: api.fastapi.model.UsersFindInfoByNameRequest) -> api.fastapi.model.UsersFindInfoByNameResponse:
+    async def find_info_by_name(self, request: api.fastapi.model.UsersFindInfoByNameRequest) -> fastapi.Response:
         input_name = request.name
         output = await self.__impl.find_info_by_name(name=input_name)
-        response = api.fastapi.model.UsersFindInfoByNameResponse(payload=api.fastapi.model.UserInfo(id_=output.id_, name=output.name) if isinstance(output, my_service.core.greeter.model.UserInfo) else api.fastapi.model.SystemInfo(name=output.name, index=output.index) if isinstance(output, my_service.core.greeter.model.SystemInfo) else None)
-        return response
+        response = api.fastapi.model.UsersFindInfoByNameResponse.model_construct(payload=api.fastapi.model.UserInfo(id_=output.id_, name=output.name) if isinstance(output, my_service.core.greeter.model.UserInfo) else api.fastapi.model.SystemInfo(name=output.name, index=output.index) if isinstance(output, my_service.core.greeter.model.SystemInfo) else None)
+        return fastapi.Response(content=api.fastapi.model.USERS_FIND_INFO_BY_NAME_RESPONSE_ADAPTER.dump_json(response, by_alias=True), media_type='application/json')
 
-    async def register(self, request: api.fastapi.model.UsersRegisterRequest) -> api.fastapi.model.UsersRegisterResponse:
+    async def register(self, request: api.fastapi.model.UsersRegisterRequest) -> fastapi.Response:
         input_name = request.name
         output = await self.__impl.register(name=input_name)
-        response = api.fastapi.model.UsersRegisterResponse(payload=api.fastapi.model.UserInfo(id_=output.id_, name=output.name))
-        return response
+        response = api.fastapi.model.UsersRegisterResponse.model_construct(payload=api.fastapi.model.UserInfo(id_=output.id_, name=output.name))
+        return fastapi.Response(content=api.fastapi.model.USERS_REGISTER_RESPONSE_ADAPTER.dump_json(response, by_alias=True), media_type='application/json')
 
 def create_users_router(handler: UsersHandler) -> fastapi.APIRouter:
     router = fastapi.APIRouter(prefix='/users', tags=['Users'])
-    router.post(path='/find_by_name', description=None)(handler.find_by_name)
-    router.post(path='/find_info_by_name', description=None)(handler.find_info_by_name)
-    router.post(path='/register', description='Register user with provided name.')(handler.register)
+    router.post(path='/find_by_name', response_model=api.fastapi.model.UsersFindByNameResponse, description=None)(handler.find_by_name)
+    router.post(path='/find_info_by_name', response_model=api.fastapi.model.UsersFindInfoByNameResponse, description=None)(handler.find_info_by_name)
+    router.post(path='/register', response_model=api.fastapi.model.UsersRegisterResponse, description='Register user with provided name.')(handler.register)
     return router
\ No newline at end of file
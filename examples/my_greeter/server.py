@@ -41,6 +41,9 @@ def create_fastapi() -> FastAPI:
     app.include_router(create_greeter_router(GreeterHandler(create_greeter())))
     app.include_router(create_users_router(UsersHandler(create_user_manager())))
 
+    # NOTE: build & cache OpenAPI schema on startup, so the first docs request does not pay for it.
+    app.openapi()
+
     return app
 
 
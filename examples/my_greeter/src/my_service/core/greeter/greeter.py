@@ -28,6 +28,7 @@ class Greeter:
 class UserManager:
     def __init__(self) -> None:
         self.__users = set[UserInfo]()
+        self.__users_by_name = dict[str, UserInfo]()
 
     async def register(self, name: str) -> UserInfo:
         """Register user with provided name."""
@@ -36,15 +37,12 @@ class UserManager:
         await asyncio.sleep(0.1)  # simulate DB call
 
         self.__users.add(user)
+        self.__users_by_name[user.name] = user
 
         return user
 
     async def find_by_name(self, name: str) -> t.Optional[UserInfo]:
-        for user in self.__users:
-            if user.name == name:
-                return user
-
-        return None
+        return self.__users_by_name.get(name)
 
     async def find_info_by_name(self, name: str) -> t.Union[UserInfo, SystemInfo, None]:
         if name == "python":
@@ -5,25 +5,35 @@ from datetime import datetime
 
 @dataclass(frozen=True)
 class SessionInfo:
+    __slots__ = ("start",)
+
     start: datetime
 
 
 @dataclass(frozen=True)
 class UserInfo:
+    __slots__ = ("id_", "name")
+
     id_: int
     name: str
 
 
 @dataclass(frozen=True)
 class SystemInfo:
+    __slots__ = ("index", "name")
+
     name: str
     index: int
 
 
 @dataclass(frozen=True)
 class ComplexStructure:
+    __slots__ = ("items",)
+
     @dataclass(frozen=True)
     class Item:
+        __slots__ = ("users",)
+
         users: t.Sequence[UserInfo]
 
     items: t.Mapping[str, Item]
@@ -24,3 +24,10 @@ class StructureController:
             )
             for i in range(3)
         ]
+
+    async def count_users(self, users: t.Sequence[UserInfo]) -> int:
+        return len(users)
+
+    async def stream_user_names(self, users: t.AsyncIterator[UserInfo]) -> t.AsyncGenerator[str, None]:
+        async for user in users:
+            yield user.name
@@ -2,6 +2,7 @@ import aiohttp
 import api.aiohttp.model
 import asyncio
 import typing
+_WS_CLOSE_MSG_TYPES = frozenset((aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSE))
 
 class NotifierClient:
 
@@ -13,7 +14,7 @@ class NotifierClient:
         async def send_requests(ws: aiohttp.ClientWebSocketResponse) -> None:
             try:
                 async for request in requests:
-                    await ws.send_json(request.model_dump(mode='json', by_alias=True, exclude_none=True))
+                    await ws.send_bytes(api.aiohttp.model.NOTIFIER_SUBSCRIBE_REQUEST_ADAPTER.dump_json(request, by_alias=True))
             finally:
                 await ws.close()
         async with self.__session.ws_connect(url='/notifier/subscribe') as ws:
@@ -23,11 +24,11 @@ class NotifierClient:
                     msg = await ws.receive()
                     if ws.closed:
                         break
-                    if msg.type in {aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSE}:
+                    if msg.type in _WS_CLOSE_MSG_TYPES:
                         continue
                     if msg.type is aiohttp.WSMsgType.ERROR:
                         raise msg.data
-                    response = api.aiohttp.model.NotifierSubscribeResponse.model_validate_json(msg.data)
+                    response = api.aiohttp.model.NOTIFIER_SUBSCRIBE_RESPONSE_ADAPTER.validate_json(msg.data)
                     yield response
             finally:
                 await sender
\ No newline at end of file
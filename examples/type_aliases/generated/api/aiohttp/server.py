@@ -16,12 +16,12 @@ class NotifierHandler:
 
         async def receive_inputs() -> typing.AsyncIterator[type_aliases.notifier.Income]:
             async for msg in websocket:
-                request = api.aiohttp.model.NotifierSubscribeRequest.model_validate_json(msg.data)
+                request = api.aiohttp.model.NOTIFIER_SUBSCRIBE_REQUEST_ADAPTER.validate_json(msg.data)
                 yield (type_aliases.notifier.Init(heartbeat=request.options.heartbeat) if isinstance(request.options, api.aiohttp.model.Init) else type_aliases.notifier.Cancel())
         await websocket.prepare(raw_request)
         async for output in self.__impl.subscribe(receive_inputs()):
-            response = api.aiohttp.model.NotifierSubscribeResponse(payload=api.aiohttp.model.Started() if isinstance(output, type_aliases.notifier.Started) else api.aiohttp.model.Heartbeat() if isinstance(output, type_aliases.notifier.Heartbeat) else api.aiohttp.model.Ended())
-            await websocket.send_str(response.model_dump_json(by_alias=True, exclude_none=True))
+            response = api.aiohttp.model.NotifierSubscribeResponse.model_construct(payload=api.aiohttp.model.Started() if isinstance(output, type_aliases.notifier.Started) else api.aiohttp.model.Heartbeat() if isinstance(output, type_aliases.notifier.Heartbeat) else api.aiohttp.model.Ended())
+            await websocket.send_bytes(api.aiohttp.model.NOTIFIER_SUBSCRIBE_RESPONSE_ADAPTER.dump_json(response, by_alias=True))
         return websocket
 
 def add_notifier_subapp(app: aiohttp.web.Application, handler: NotifierHandler) -> None:
@@ -16,10 +16,9 @@ class NotifierClient:
         done = threading.Event()
 
         def send_requests(ws: httpx_ws.WebSocketSession) -> None:
-            done.clear()
             try:
                 for request in requests:
-                    ws.send_text(request.model_dump_json(by_alias=True, exclude_none=True))
+                    ws.send_bytes(api.fastapi.model.NOTIFIER_SUBSCRIBE_REQUEST_ADAPTER.dump_json(request, by_alias=True))
             finally:
                 done.set()
                 ws.close()
@@ -28,7 +27,7 @@ class NotifierClient:
             sender.start()
             while not done.is_set():
                 try:
-                    raw_response = ws.receive_text(timeout=receive_timeout)
+                    raw_response = ws.receive_bytes(timeout=receive_timeout)
                 except queue.Empty:
                     continue
                 except (httpx_ws.WebSocketNetworkError, httpx_ws.WebSocketDisconnect) as err:
@@ -36,7 +35,7 @@ class NotifierClient:
                         break
                     raise err
                 else:
-                    response = api.fastapi.model.NotifierSubscribeResponse.model_validate_json(raw_response)
+                    response = api.fastapi.model.NOTIFIER_SUBSCRIBE_RESPONSE_ADAPTER.validate_json(raw_response)
                     yield response
 
 class NotifierAsyncClient:
@@ -49,7 +48,7 @@ class NotifierAsyncClient:
         async def send_requests(ws: httpx_ws.AsyncWebSocketSession) -> None:
             try:
                 async for request in requests:
-                    await ws.send_text(request.model_dump_json(by_alias=True, exclude_none=True))
+                    await ws.send_bytes(api.fastapi.model.NOTIFIER_SUBSCRIBE_REQUEST_ADAPTER.dump_json(request, by_alias=True))
             finally:
                 await ws.close()
         async with httpx_ws.aconnect_ws(url='/notifier/subscribe', client=self.__impl) as ws:
@@ -57,7 +56,7 @@ class NotifierAsyncClient:
             try:
                 while not sender.done():
                     try:
-                        raw_response = await ws.receive_text(timeout=receive_timeout)
+                        raw_response = await ws.receive_bytes(timeout=receive_timeout)
                     except queue.Empty:
                         continue
                     except (httpx_ws.WebSocketNetworkError, httpx_ws.WebSocketDisconnect) as err:
@@ -65,7 +64,7 @@ class NotifierAsyncClient:
                             break
                         raise err
                     else:
-                        response = api.fastapi.model.NotifierSubscribeResponse.model_validate_json(raw_response)
+                        response = api.fastapi.model.NOTIFIER_SUBSCRIBE_RESPONSE_ADAPTER.validate_json(raw_response)
                         yield response
             finally:
                 await sender
\ No newline at end of file
@@ -12,6 +12,7 @@ type Income = Init | Cancel
 class NotifierSubscribeRequest(pydantic.BaseModel):
     """Request DTO for :class:`type_aliases.notifier.Notifier` :meth:`subscribe` entrypoint method."""
     options: Income
+NOTIFIER_SUBSCRIBE_REQUEST_ADAPTER = pydantic.TypeAdapter(NotifierSubscribeRequest)
 
 class Started(pydantic.BaseModel):
     """DTO for :class:`type_aliases.notifier.Started` type."""
@@ -25,4 +26,5 @@ type Outcome = Started | Heartbeat | Ended
 
 class NotifierSubscribeResponse(pydantic.BaseModel):
     """Response DTO for :class:`type_aliases.notifier.Notifier` :meth:`subscribe` entrypoint method."""
-    payload: Outcome
\ No newline at end of file
+    payload: Outcome
+NOTIFIER_SUBSCRIBE_RESPONSE_ADAPTER = pydantic.TypeAdapter(NotifierSubscribeResponse)
\ No newline at end of file
@@ -11,14 +11,14 @@ class NotifierHandler:
     async def subscribe(self, websocket: fastapi.WebSocket) -> None:
 
         async def receive_inputs() -> typing.AsyncIterator[type_aliases.notifier.Income]:
-            async for request_text in websocket.iter_text():
-                request = api.fastapi.model.NotifierSubscribeRequest.model_validate_json(request_text)
+            async for request_bytes in websocket.iter_bytes():
+                request = api.fastapi.model.NOTIFIER_SUBSCRIBE_REQUEST_ADAPTER.validate_json(request_bytes)
                 yield (type_aliases.notifier.Init(heartbeat=request.options.heartbeat) if isinstance(request.options, api.fastapi.model.Init) else type_aliases.notifier.Cancel())
         try:
             await websocket.accept()
             async for output in self.__impl.subscribe(receive_inputs()):
-                response = api.fastapi.model.NotifierSubscribeResponse(payload=api.fastapi.model.Started() if isinstance(output, type_aliases.notifier.Started) else api.fastapi.model.Heartbeat() if isinstance(output, type_aliases.notifier.Heartbeat) else api.fastapi.model.Ended())
-                await websocket.send_text(response.model_dump_json(by_alias=True, exclude_none=True))
+                response = api.fastapi.model.NotifierSubscribeResponse.model_construct(payload=api.fastapi.model.Started() if isinstance(output, type_aliases.notifier.Started) else api.fastapi.model.Heartbeat() if isinstance(output, type_aliases.notifier.Heartbeat) else api.fastapi.model.Ended())
+                await websocket.send_bytes(api.fastapi.model.NOTIFIER_SUBSCRIBE_RESPONSE_ADAPTER.dump_json(response, by_alias=True))
         except fastapi.WebSocketDisconnect:
             pass
 
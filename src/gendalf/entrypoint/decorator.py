@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import typing as t
 from dataclasses import dataclass
-from functools import partial
 
 T = t.TypeVar("T")
 
@@ -52,8 +51,10 @@ def entrypoint(
     if type_ is not None:
         return _mark_entrypoint(type_, config)
 
-    # NOTE: mypy thinks that `T` of `_mark_entrypoint` is not the same `T` of `entrypoint`
-    return t.cast("t.Callable[[type[T]], type[T]]", partial(_mark_entrypoint, config=config))
+    def mark(inner: type[T]) -> type[T]:
+        return _mark_entrypoint(inner, config)
+
+    return mark
 
 
 def _mark_entrypoint(type_: type[T], config: EntrypointConfig) -> type[T]:
@@ -63,5 +64,4 @@ def _mark_entrypoint(type_: type[T], config: EntrypointConfig) -> type[T]:
 
 def get_entrypoint_config(obj: object) -> t.Optional[EntrypointConfig]:
     opts: object = getattr(obj, __ENTRYPOINT_CONFIG_ATTR, None)
-    assert opts is None or isinstance(opts, EntrypointConfig)
-    return opts
+    return opts if isinstance(opts, EntrypointConfig) else None
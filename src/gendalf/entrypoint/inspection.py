@@ -1,16 +1,23 @@
 import abc
 import inspect
 import typing as t
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Generator, Iterable, Iterator
+from itertools import islice
 from pathlib import Path
 from types import ModuleType
 
 from astlab.reader import walk_package_modules
-from astlab.types import ModuleLoader, NamedTypeInfo, TypeInfo, TypeInspector
+from astlab.types import ModuleLoader, NamedTypeInfo, RuntimeType, TypeInfo, TypeInspector
 
 from gendalf.entrypoint.decorator import get_entrypoint_config
 from gendalf.model import EntrypointInfo, MethodInfo, ParameterInfo, StreamStreamMethodInfo, UnaryUnaryMethodInfo
 from gendalf.option import Option
 
+_EMPTY_DEFAULT: t.Final[Option[object]] = Option[object].empty()
+_STREAM_ORIGINS: t.Final[frozenset[object]] = frozenset(
+    (Iterator, Iterable, Generator, AsyncIterator, AsyncIterable, AsyncGenerator)
+)
+
 
 class Func(t.Protocol):
     @abc.abstractmethod
@@ -22,6 +29,7 @@ class EntrypointInspector:
     def __init__(self, loader: ModuleLoader, inspector: TypeInspector) -> None:
         self.__loader = loader
         self.__inspector = inspector
+        self.__types = dict[int, tuple[RuntimeType, TypeInfo]]()
 
     def inspect_source(
         self,
@@ -53,12 +61,12 @@ class EntrypointInspector:
                 yield from self.inspect_module(module)
 
     def inspect_module(self, module: ModuleType) -> t.Iterable[EntrypointInfo]:
-        for name, obj in inspect.getmembers(module):
-            if not inspect.isclass(obj) or obj.__module__ != module.__name__:
-                continue
+        for name in dir(module):
+            obj = getattr(module, name, None)
 
+            # NOTE: most module members are not entrypoints, check the marker first.
             opts = get_entrypoint_config(obj)
-            if opts is None:
+            if opts is None or not inspect.isclass(obj) or obj.__module__ != module.__name__:
                 continue
 
             type_info = self.__inspector.inspect(obj)
@@ -69,19 +77,25 @@ class EntrypointInspector:
             yield EntrypointInfo(
                 name=opts.name if opts.name is not None else name,
                 type_=type_info,
-                methods=tuple(
-                    self.__inspect_method(member_name, member)
-                    for member_name, member in inspect.getmembers(obj)
-                    if not member_name.startswith("_") and callable(member)
-                ),
+                methods=tuple(self.__inspect_methods(obj)),
                 doc=inspect.getdoc(obj),
             )
 
+    def __inspect_methods(self, obj: type[object]) -> t.Iterable[MethodInfo]:
+        # NOTE: `dir` is sorted as `inspect.getmembers`, but private names are skipped before attribute access.
+        for name in dir(obj):
+            if name.startswith("_"):
+                continue
+
+            member = getattr(obj, name, None)
+            if callable(member):
+                yield self.__inspect_method(name, member)
+
     def __inspect_method(self, name: str, func: Func) -> MethodInfo:
         signature = inspect.signature(func)
 
         # skip `self`
-        params = list(signature.parameters.values())[1:]
+        params = list(islice(signature.parameters.values(), 1, None))
 
         if len(params) == 1 and (streaming_type := self.__extract_streaming_type(params[0].annotation)) is not None:
             input_stream_param = params[0]
@@ -93,7 +107,7 @@ class EntrypointInspector:
                     type_=streaming_type,
                     default=Option(input_stream_param.default)
                     if input_stream_param.default is not input_stream_param.empty
-                    else Option[object].empty(),
+                    else _EMPTY_DEFAULT,
                 ),
                 output=self.__extract_streaming_type(signature.return_annotation)
                 if signature.return_annotation is not None
@@ -105,27 +119,42 @@ class EntrypointInspector:
             name=name,
             is_async=inspect.iscoroutinefunction(func),
             params=[self.__build_param(param) for param in params],
-            returns=self.__inspector.inspect(signature.return_annotation)
+            returns=self.__inspect_type(signature.return_annotation)
             if signature.return_annotation is not None
             else None,
             doc=inspect.getdoc(func),
         )
 
     def __extract_streaming_type(self, obj: object) -> t.Optional[TypeInfo]:
-        origin = t.get_origin(obj)
-        if not isinstance(origin, type) or not issubclass(
-            origin, (t.Iterator, t.Iterable, t.AsyncIterator, t.AsyncIterable)
-        ):
+        # NOTE: plain classes (the most common annotations) can't be parametrized iterators. `isinstance` check is not
+        # used, because `list[int]` is an instance of `type` on python < 3.11.
+        if type(obj) is type:
+            return None
+
+        # NOTE: `typing` aliases resolve to `collections.abc` origins, so no `issubclass` ABC hooks are needed.
+        if t.get_origin(obj) not in _STREAM_ORIGINS:
             return None
 
+        # NOTE: generators also have send (and return) type params, only the yield type is streamed.
         args = t.get_args(obj)
-        assert len(args) == 1
+        if not args:
+            msg = "streaming type must be parametrized"
+            raise TypeError(msg, obj)
+
+        return self.__inspect_type(args[0])
+
+    def __inspect_type(self, obj: RuntimeType) -> TypeInfo:
+        # NOTE: annotations may be unhashable, so they are keyed by `id`, the annotation is kept to prevent `id` reuse.
+        cached = self.__types.get(id(obj))
+        if cached is None:
+            cached = self.__types[id(obj)] = (obj, self.__inspector.inspect(obj))
 
-        return self.__inspector.inspect(args[0])
+        return cached[1]
 
     def __build_param(self, param: inspect.Parameter) -> ParameterInfo:
         return ParameterInfo(
             name=param.name,
-            type_=self.__inspector.inspect(param.annotation),
-            default=Option(param.default) if param.default is not param.empty else Option[object].empty(),
+            type_=self.__inspect_type(param.annotation),
+            default=Option(param.default) if param.default is not param.empty else _EMPTY_DEFAULT,
+            is_positional=param.kind in {param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD},
         )
@@ -1,4 +1,3 @@
-import io
 import typing as t
 from dataclasses import replace
 
@@ -19,6 +18,7 @@ class Printer(Visitor):
     def __init__(self, dest: t.IO[str], annotator: TypeAnnotator) -> None:
         self.__dest = dest
         self.__annotator = annotator
+        self.__iterator = predef().iterator
 
     @override
     def visit_entrypoint(self, info: EntrypointInfo) -> None:
@@ -55,9 +55,7 @@ class Printer(Visitor):
         pass
 
     def __write_line(self, line: str, indent: int = 0) -> None:
-        self.__write_indent(indent)
-        self.__dest.write(line)
-        self.__write_new_line()
+        self.__dest.write(f"{' ' * 4 * indent}{line}\n")
 
     def __write_indent(self, indent: int) -> None:
         self.__dest.write(" " * 4 * indent)
@@ -71,22 +69,22 @@ class Printer(Visitor):
         params: t.Sequence[ParameterInfo],
         returns: t.Optional[TypeInfo],
     ) -> None:
-        with io.StringIO() as ss:
-            ss.write(f"* {info.name}(")
+        self.__write_indent(1)
+        self.__dest.write(f"* {info.name}(")
 
-            for i, param in enumerate(params):
-                if i > 0:
-                    ss.write(", ")
+        for i, param in enumerate(params):
+            if i > 0:
+                self.__dest.write(", ")
 
-                ss.write(f"{param.name}: {self.__annotator.annotate(param.type_)}")
-                if param.default.is_set:
-                    ss.write(f" = {param.default.value()}")
+            self.__dest.write(f"{param.name}: {self.__annotator.annotate(param.type_)}")
+            if param.default.is_set:
+                self.__dest.write(f" = {param.default.value()}")
 
-            ss.write(")")
-            if returns is not None:
-                ss.write(f" -> {self.__annotator.annotate(returns)}")
+        self.__dest.write(")")
+        if returns is not None:
+            self.__dest.write(f" -> {self.__annotator.annotate(returns)}")
 
-            self.__write_line(ss.getvalue(), 1)
+        self.__write_new_line()
 
         self.__write_doc(info.doc, 1)
 
@@ -100,4 +98,4 @@ class Printer(Visitor):
         self.__write_line(f'"""{normalized_doc}"""', indent + 1)
 
     def __to_iterator(self, type_: TypeInfo) -> TypeInfo:
-        return replace(predef().iterator, type_params=(type_,))
+        return replace(self.__iterator, type_params=(type_,))
@@ -40,9 +40,6 @@ class AiohttpModel(TypeDefinitionBuilder):
     def ref(self) -> TypeRefBuilder:
         return self.__ref
 
-    def build_load_json_expr(self, scope: ScopeASTBuilder, source: Expr) -> Expr:
-        return self.__mapper.mode("json").build_dto_decode_expr(scope, self.info, source)
-
     def build_model_to_domain_param_stmts(
         self,
         scope: ScopeASTBuilder,
@@ -69,13 +66,14 @@ class AiohttpModel(TypeDefinitionBuilder):
         domain: TypeInfo,
         source: AttrASTBuilder,
     ) -> Expr:
-        return scope.call(self.__ref).kwarg(
-            "payload",
-            self.__mapper.build_domain_to_dto_expr(scope, domain, source),
+        return self.__mapper.build_dto_construct_expr(
+            scope,
+            self.info,
+            {"payload": self.__mapper.build_domain_to_dto_expr(scope, domain, source)},
         )
 
-    def build_dump_serializable_expr(self, scope: ScopeASTBuilder, source: Expr) -> Expr:
-        return self.__mapper.mode("serializable").build_dto_encode_expr(scope, self.info, source)
+    def build_load_json_expr(self, scope: ScopeASTBuilder, source: Expr) -> Expr:
+        return self.__mapper.mode("json").build_dto_decode_expr(scope, self.info, source)
 
     def build_dump_json_expr(self, scope: ScopeASTBuilder, source: Expr) -> Expr:
         return self.__mapper.mode("json").build_dto_encode_expr(scope, self.info, source)
@@ -190,7 +188,7 @@ class AiohttpModelRegistry:
         method: MethodInfo,
         suffix: str,
     ) -> str:
-        return "".join(snake2camel(s) for s in (entrypoint.name, method.name, suffix))
+        return f"{snake2camel(entrypoint.name)}{snake2camel(method.name)}{snake2camel(suffix)}"
 
 
 class AiohttpCodeGenerator(CodeGenerator):
@@ -311,7 +309,8 @@ class AiohttpCodeGenerator(CodeGenerator):
             .async_() as method_def
         ):
             scope.assign_stmt(
-                "request", request_model.build_load_json_expr(scope, scope.attr("raw_request", "read").call().await_())
+                "request",
+                request_model.build_load_json_expr(scope, scope.attr("raw_request", "read").call().await_()),
             )
 
             input_params = {f"input_{param.name}": param for param in method.params}
@@ -331,6 +330,20 @@ class AiohttpCodeGenerator(CodeGenerator):
                     .await_()
                 )
 
+            elif all(param.is_positional for param in method.params):
+                impl_call = (
+                    scope.call(self.__asyncio_get_running_loop)
+                    .attr("run_in_executor")
+                    .call(
+                        args=[
+                            method_def.self_attr("executor"),
+                            method_def.self_attr("impl", method.name),
+                            *(scope.attr(input_name) for input_name in input_params),
+                        ],
+                    )
+                    .await_()
+                )
+
             else:
                 impl_call = (
                     scope.call(self.__asyncio_get_running_loop)
@@ -354,14 +367,16 @@ class AiohttpCodeGenerator(CodeGenerator):
                     response_model.build_domain_to_model_expr(method_def, method.returns, scope.attr("output")),
                 )
                 scope.return_stmt(
-                    scope.call(self.__aiohttp_json_response).kwarg(
-                        "data", response_model.build_dump_serializable_expr(scope, scope.attr("response"))
-                    )
+                    scope.call(self.__aiohttp_response)
+                    .kwarg("body", response_model.build_dump_json_expr(scope, scope.attr("response")))
+                    .kwarg("content_type", scope.const("application/json"))
                 )
 
             else:
                 scope.stmt(impl_call)
-                scope.return_stmt(scope.call(self.__aiohttp_json_response))
+                scope.return_stmt(
+                    scope.call(self.__aiohttp_response).kwarg("content_type", scope.const("application/json"))
+                )
 
     def __build_server_handler_method_stream_stream(
         self,
@@ -433,7 +448,7 @@ class AiohttpCodeGenerator(CodeGenerator):
                     ),
                 )
                 scope.stmt(
-                    scope.attr("websocket", "send_str")
+                    scope.attr("websocket", "send_bytes")
                     .call()
                     .arg(response_model.build_dump_json_expr(scope, scope.attr("response")))
                     .await_(),
@@ -489,6 +504,8 @@ class AiohttpCodeGenerator(CodeGenerator):
         registry: AiohttpModelRegistry,
     ) -> None:
         with pkg.module("client") as client:
+            self.__build_client_module_constants(context, client, registry)
+
             for entrypoint in context.entrypoints:
                 with client.class_def(f"{snake2camel(entrypoint.name)}Client") as client_class:
                     with client_class.init_self_attrs_def({"session": self.__aiohttp_client_session}):
@@ -504,6 +521,40 @@ class AiohttpCodeGenerator(CodeGenerator):
                         else:
                             assert_never(method)
 
+    def __build_client_module_constants(
+        self,
+        context: CodeGeneratorContext,
+        client: ModuleASTBuilder,
+        registry: AiohttpModelRegistry,
+    ) -> None:
+        if any(
+            isinstance(method, UnaryUnaryMethodInfo)
+            for entrypoint in context.entrypoints
+            for method in entrypoint.methods
+        ):
+            client.assign_stmt(
+                target="_JSON_HEADERS",
+                value=client.dict_expr({client.const("Content-Type"): client.const("application/json")}),
+            )
+
+        if any(
+            isinstance(method, StreamStreamMethodInfo)
+            for entrypoint in context.entrypoints
+            for method in entrypoint.methods
+        ):
+            client.assign_stmt(
+                target="_WS_CLOSE_MSG_TYPES",
+                value=client.attr("frozenset")
+                .call()
+                .arg(
+                    client.tuple_expr(
+                        client.attr(self.__aiohttp_ws_msg_type, "CLOSING"),
+                        client.attr(self.__aiohttp_ws_msg_type, "CLOSED"),
+                        client.attr(self.__aiohttp_ws_msg_type, "CLOSE"),
+                    )
+                ),
+            )
+
     def __build_client_method_unary_unary(
         self,
         scope: ClassScopeASTBuilder,
@@ -527,7 +578,8 @@ class AiohttpCodeGenerator(CodeGenerator):
                     cm=method_def.self_attr("session", "post")
                     .call()
                     .kwarg("url", scope.const(f"/{camel2snake(entrypoint.name)}/{method.name}"))
-                    .kwarg("json", request_model.build_dump_serializable_expr(scope, scope.attr("request"))),
+                    .kwarg("data", request_model.build_dump_json_expr(scope, scope.attr("request")))
+                    .kwarg("headers", scope.attr("_JSON_HEADERS")),
                     name="raw_response",
                 )
                 .body()
@@ -576,9 +628,9 @@ class AiohttpCodeGenerator(CodeGenerator):
                     with try_stmt.body():
                         with scope.for_stmt("request", scope.attr("requests")).async_().body():
                             scope.stmt(
-                                scope.attr("ws", "send_json")
+                                scope.attr("ws", "send_bytes")
                                 .call()
-                                .arg(request_model.build_dump_serializable_expr(scope, scope.attr("request")))
+                                .arg(request_model.build_dump_json_expr(scope, scope.attr("request")))
                                 .await_(),
                             )
 
@@ -616,13 +668,7 @@ class AiohttpCodeGenerator(CodeGenerator):
                             with scope.if_stmt(
                                 scope.compare_in_expr(
                                     scope.attr("msg", "type"),
-                                    scope.set_expr(
-                                        [
-                                            scope.attr(self.__aiohttp_ws_msg_type, "CLOSING"),
-                                            scope.attr(self.__aiohttp_ws_msg_type, "CLOSED"),
-                                            scope.attr(self.__aiohttp_ws_msg_type, "CLOSE"),
-                                        ]
-                                    ),
+                                    scope.attr("_WS_CLOSE_MSG_TYPES"),
                                 )
                             ).body():
                                 scope.continue_stmt()
@@ -691,7 +737,3 @@ class AiohttpCodeGenerator(CodeGenerator):
     @cached_property
     def __aiohttp_response(self) -> TypeInfo:
         return NamedTypeInfo.build(self.__aiohttp_web, "Response")
-
-    @cached_property
-    def __aiohttp_json_response(self) -> TypeInfo:
-        return NamedTypeInfo.build(self.__aiohttp_web, "json_response")
@@ -89,6 +89,7 @@ class OutboundDtoMapper(metaclass=abc.ABCMeta):
     Build outbound DTO mapping expressions.
 
     * Domain → DTO (aka outbound mapping, build DTO from domain object)
+    * DTO construction (build DTO from trusted field values)
     * DTO encoding (serialize / dump DTO to raw format)
     """
 
@@ -103,6 +104,17 @@ class OutboundDtoMapper(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def build_dto_construct_expr(self, scope: ScopeASTBuilder, dto: TypeInfo, fields: t.Mapping[str, Expr]) -> Expr:
+        """
+        Build DTO construct expression from already mapped field values in the given scope (values are trusted).
+
+        :scope: keeps generated code
+        :dto: a reference to DTO class definition
+        :fields: DTO field value expressions by field names
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def build_dto_encode_expr(self, scope: ScopeASTBuilder, dto: TypeInfo, source: Expr) -> Expr:
         """
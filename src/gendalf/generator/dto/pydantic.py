@@ -29,6 +29,7 @@ from astlab.types import (
 from gendalf._typing import assert_never, override
 from gendalf.generator.dto.abc import DtoMapper, DuplexDtoMapper
 from gendalf.generator.dto.traverse import traverse_post_order
+from gendalf.string_case import camel2snake
 
 if sys.version_info >= (3, 12):
     from typing import TypeAliasType
@@ -83,7 +84,8 @@ class PydanticDtoMapper(DtoMapper):
         self.__inspector = inspector if inspector is not None else TypeInspector()
         self.__annotator = annotator if annotator is not None else TypeAnnotator()
         self.__domain_to_dto = dict[TypeInfo, DomainTypeMapping]()
-        self.__mapper = PydanticDuplexDtoMapper(self.__domain_to_dto, mode)
+        self.__dto_adapters = dict[TypeInfo, TypeInfo]()
+        self.__mapper = PydanticDuplexDtoMapper(self.__domain_to_dto, self.__dto_adapters, mode)
 
     @t.overload
     def create_dto_def(
@@ -124,6 +126,8 @@ class PydanticDtoMapper(DtoMapper):
                 for field, annotation in fields.items():
                     class_def.field_def(field, self.__domain_to_dto[annotation].dto)
 
+            self.__build_dto_adapter(scope, class_def.info)
+
             return class_def.ref()
 
         else:
@@ -131,14 +135,14 @@ class PydanticDtoMapper(DtoMapper):
 
     def mode(self, value: t.Optional[PydanticMode]) -> DuplexDtoMapper:
         return (
-            PydanticDuplexDtoMapper(self.__domain_to_dto, value)
+            PydanticDuplexDtoMapper(self.__domain_to_dto, self.__dto_adapters, value)
             if value is not None and value != self.__mapper.mode
             else self.__mapper
         )
 
     @override
     def build_dto_decode_expr(self, scope: ScopeASTBuilder, dto: TypeInfo, source: Expr) -> Expr:
-        return self.__mapper.build_dto_encode_expr(scope, dto, source)
+        return self.__mapper.build_dto_decode_expr(scope, dto, source)
 
     @override
     def build_dto_to_domain_expr(self, scope: ScopeASTBuilder, domain: TypeInfo, source: AttrASTBuilder) -> Expr:
@@ -148,10 +152,23 @@ class PydanticDtoMapper(DtoMapper):
     def build_domain_to_dto_expr(self, scope: ScopeASTBuilder, domain: TypeInfo, source: AttrASTBuilder) -> Expr:
         return self.__mapper.build_domain_to_dto_expr(scope, domain, source)
 
+    @override
+    def build_dto_construct_expr(self, scope: ScopeASTBuilder, dto: TypeInfo, fields: t.Mapping[str, Expr]) -> Expr:
+        return self.__mapper.build_dto_construct_expr(scope, dto, fields)
+
     @override
     def build_dto_encode_expr(self, scope: ScopeASTBuilder, dto: TypeInfo, source: Expr) -> Expr:
         return self.__mapper.build_dto_encode_expr(scope, dto, source)
 
+    def __build_dto_adapter(self, scope: ScopeASTBuilder, dto: TypeInfo) -> None:
+        # NOTE: adapter is defined next to the DTO class, so json mode codecs can refer to it from any module.
+        if not isinstance(dto, NamedTypeInfo) or dto.module is None:
+            return
+
+        adapter = NamedTypeInfo.build(dto.module, f"{camel2snake(dto.name).upper()}_ADAPTER")
+        scope.assign_stmt(adapter.name, scope.call(self.__type_adapter).arg(scope.type_ref(dto)))
+        self.__dto_adapters[dto] = adapter
+
     def __build_type_mapping(self, scope: ScopeASTBuilder, infos: t.Sequence[TypeInfo]) -> None:
         for result in traverse_post_order(
             nodes=infos,
@@ -401,25 +418,27 @@ class PydanticDtoMapper(DtoMapper):
                     source_type: TypeInfo,
                     target_type: TypeInfo,
                 ) -> Expr:
+                    key = self.__build_attr(scope, source, "key")
+                    value = self.__build_attr(scope, source, "value")
+                    source_key_type, source_value_type = self.__extract_nested(source_type)
+                    target_key_type, target_value_type = self.__extract_nested(target_type)
+
                     return scope.dict_expr(
                         items=Comprehension(
-                            target=scope.tuple_expr(
-                                self.__build_attr(scope, source, "key"),
-                                self.__build_attr(scope, source, "value"),
-                            ),
+                            target=scope.tuple_expr(key, value),
                             items=scope.attr(source, "items").call(),
                         ),
                         key=key_map.mapper(
                             scope=scope,
-                            source=self.__build_attr(scope, source, "key"),
-                            source_type=self.__extract_nested(source_type)[0],
-                            target_type=self.__extract_nested(target_type)[0],
+                            source=key,
+                            source_type=source_key_type,
+                            target_type=target_key_type,
                         ),
                         value=value_map.mapper(
                             scope=scope,
-                            source=self.__build_attr(scope, source, "value"),
-                            source_type=self.__extract_nested(source_type)[1],
-                            target_type=self.__extract_nested(target_type)[1],
+                            source=value,
+                            source_type=source_value_type,
+                            target_type=target_value_type,
                         ),
                     )
 
@@ -440,14 +459,16 @@ class PydanticDtoMapper(DtoMapper):
                     source_type: TypeInfo,
                     target_type: TypeInfo,
                 ) -> Expr:
+                    item = self.__build_attr(scope, source, "item")
+
                     return scope.list_expr(
                         items=Comprehension(
-                            target=self.__build_attr(scope, source, "item"),
+                            target=item,
                             items=source,
                         ),
                         element=of_type.mapper(
                             scope=scope,
-                            source=self.__build_attr(scope, source, "item"),
+                            source=item,
                             source_type=self.__extract_nested(source_type)[0],
                             target_type=self.__extract_nested(target_type)[0],
                         ),
@@ -470,14 +491,16 @@ class PydanticDtoMapper(DtoMapper):
                     source_type: TypeInfo,
                     target_type: TypeInfo,
                 ) -> Expr:
+                    item = self.__build_attr(scope, source, "item")
+
                     return scope.set_expr(
                         items=Comprehension(
-                            target=self.__build_attr(scope, source, "item"),
+                            target=item,
                             items=source,
                         ),
                         element=of_type.mapper(
                             scope=scope,
-                            source=self.__build_attr(scope, source, "item"),
+                            source=item,
                             source_type=self.__extract_nested(source_type)[0],
                             target_type=self.__extract_nested(target_type)[0],
                         ),
@@ -502,6 +525,7 @@ class PydanticDtoMapper(DtoMapper):
     # TODO: generic struct case
     def __process_structure(self, rtt: RuntimeType, info: NamedTypeInfo) -> ProcessedDomainType:
         fields = self.__extract_fields(rtt)
+        is_positional = self.__check_if_positional_init(rtt, [name for name, _ in fields])
 
         def create(mod: ScopeASTBuilder) -> DomainTypeMapping:
             field_mappings = {name: self.__domain_to_dto[annotation] for name, annotation in fields}
@@ -523,18 +547,21 @@ class PydanticDtoMapper(DtoMapper):
                 source_type: TypeInfo,
                 target_type: TypeInfo,
             ) -> Expr:
-                return scope.call(
-                    func=target_type,
-                    kwargs={
-                        name: field_map.mapper(
-                            scope=scope,
-                            source=scope.attr(source, name),
-                            source_type=get_field_type(source_type, name),
-                            target_type=get_field_type(target_type, name),
-                        )
-                        for name, field_map in field_mappings.items()
-                    },
-                )
+                values = {
+                    name: field_map.mapper(
+                        scope=scope,
+                        source=scope.attr(source, name),
+                        source_type=get_field_type(source_type, name),
+                        target_type=get_field_type(target_type, name),
+                    )
+                    for name, field_map in field_mappings.items()
+                }
+
+                # NOTE: pydantic models accept keyword arguments only, domain dataclasses may be built positionally.
+                if target_type == info and is_positional:
+                    return scope.call(func=target_type, args=list(values.values()))
+
+                return scope.call(func=target_type, kwargs=values)
 
             return DomainTypeMapping(
                 dto=class_def.info,
@@ -601,6 +628,10 @@ class PydanticDtoMapper(DtoMapper):
     def __base_model(self) -> TypeInfo:
         return NamedTypeInfo.build("pydantic", "BaseModel")
 
+    @cached_property
+    def __type_adapter(self) -> TypeInfo:
+        return NamedTypeInfo.build("pydantic", "TypeAdapter")
+
     @cached_property
     def __scalar_types(self) -> tuple[type[object], ...]:
         return (
@@ -663,6 +694,19 @@ class PydanticDtoMapper(DtoMapper):
     def __get_nested_mappings(self, domain: t.Union[NamedTypeInfo, UnionTypeInfo]) -> t.Sequence[DomainTypeMapping]:
         return tuple(self.__domain_to_dto[typ] for typ in self.__extract_nested(domain))
 
+    def __check_if_positional_init(self, rtt: RuntimeType, names: t.Sequence[str]) -> bool:
+        try:
+            signature = inspect.signature(t.cast("t.Callable[..., object]", rtt))
+        except (TypeError, ValueError):
+            return False
+
+        params = list(signature.parameters.values())
+
+        return [param.name for param in params] == list(names) and all(
+            param.kind in {inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD}
+            for param in params
+        )
+
     def __extract_fields(self, rtt: RuntimeType) -> t.Sequence[tuple[str, TypeInfo]]:
         if is_dataclass(rtt):
             # TODO: solve dataclass field forward ref
@@ -685,8 +729,14 @@ class PydanticDtoMapper(DtoMapper):
 
 
 class PydanticDuplexDtoMapper(DuplexDtoMapper):
-    def __init__(self, registry: t.Mapping[TypeInfo, DomainTypeMapping], mode: PydanticMode) -> None:
+    def __init__(
+        self,
+        registry: t.Mapping[TypeInfo, DomainTypeMapping],
+        adapters: t.Mapping[TypeInfo, TypeInfo],
+        mode: PydanticMode,
+    ) -> None:
         self.__registry = registry
+        self.__adapters = adapters
         self.__mode = mode
 
     @property
@@ -695,7 +745,14 @@ class PydanticDuplexDtoMapper(DuplexDtoMapper):
 
     @override
     def build_dto_decode_expr(self, scope: ScopeASTBuilder, dto: TypeInfo, source: Expr) -> Expr:
-        return scope.attr(dto, "model_validate_json" if self.__mode == "json" else "model_validate").call().arg(source)
+        if self.__mode == "json":
+            adapter = self.__adapters.get(dto)
+            if adapter is not None:
+                return scope.attr(adapter, "validate_json").call().arg(source)
+
+            return scope.attr(dto, "model_validate_json").call().arg(source)
+
+        return scope.attr(dto, "model_validate").call().arg(source)
 
     @override
     def build_dto_to_domain_expr(self, scope: ScopeASTBuilder, domain: TypeInfo, source: AttrASTBuilder) -> Expr:
@@ -707,11 +764,25 @@ class PydanticDuplexDtoMapper(DuplexDtoMapper):
         mapping = self.__registry[domain]
         return mapping.mapper(scope, source, mapping.domain, mapping.dto)
 
+    @override
+    def build_dto_construct_expr(self, scope: ScopeASTBuilder, dto: TypeInfo, fields: t.Mapping[str, Expr]) -> Expr:
+        return scope.attr(dto, "model_construct").call(kwargs=fields)
+
     @override
     def build_dto_encode_expr(self, scope: ScopeASTBuilder, dto: TypeInfo, source: Expr) -> Expr:
-        return (
-            scope.attr(source, "model_dump_json" if self.__mode == "json" else "model_dump")
-            .call(kwargs={"mode": scope.const("json")} if self.__mode == "serializable" else None)
-            .kwarg("by_alias", scope.const(value=True))
-            .kwarg("exclude_none", scope.const(value=True))
-        )
+        # NOTE: `exclude_none` is deliberately not passed, DTO fields have no defaults, so `None` values must be dumped
+        # explicitly to be decoded back.
+        adapter = self.__adapters.get(dto)
+
+        if self.__mode == "json" and adapter is not None:
+            call = scope.attr(adapter, "dump_json").call().arg(source)
+
+        elif self.__mode == "json":
+            call = scope.attr(source, "model_dump_json").call()
+
+        else:
+            call = scope.attr(source, "model_dump").call(
+                kwargs={"mode": scope.const("json")} if self.__mode == "serializable" else None
+            )
+
+        return call.kwarg("by_alias", scope.const(value=True))
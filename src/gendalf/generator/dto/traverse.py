@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import typing as t
-from collections import deque
 
 A = t.TypeVar("A")
 B = t.TypeVar("B")
@@ -14,7 +13,16 @@ def traverse_post_order(
     transform: t.Callable[[A], B],
     ancestors: t.Callable[[B], t.Sequence[A]],
 ) -> t.Iterable[B]:
-    stack = deque[tuple[A, B, bool]]([(node, transform(node), False) for node in nodes if predicate(node)])
+    # NOTE: a node may be reached from several dependants before it is processed, transform it only once.
+    transformed = dict[A, B]()
+
+    def transform_once(node: A) -> B:
+        if node not in transformed:
+            transformed[node] = transform(node)
+
+        return transformed[node]
+
+    stack = [(node, transform_once(node), False) for node in nodes if predicate(node)]
     visited = set[A]()
 
     while stack:
@@ -29,7 +37,7 @@ def traverse_post_order(
         else:
             stack.append((node, result, True))
             stack.extend(
-                (ancestor, transform(ancestor), False)
+                (ancestor, transform_once(ancestor), False)
                 for ancestor in reversed(ancestors(result))
                 if ancestor is not node and ancestor not in visited and predicate(ancestor)
             )
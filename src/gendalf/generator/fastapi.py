@@ -37,9 +37,6 @@ class FastAPIModel(TypeDefinitionBuilder):
     def ref(self) -> TypeRefBuilder:
         return self.__ref
 
-    def build_load_json_expr(self, scope: ScopeASTBuilder, source: Expr) -> Expr:
-        return self.__mapper.mode("json").build_dto_decode_expr(scope, self.info, source)
-
     def build_model_to_domain_param_stmts(
         self,
         scope: ScopeASTBuilder,
@@ -56,17 +53,18 @@ class FastAPIModel(TypeDefinitionBuilder):
         return self.__mapper.build_dto_to_domain_expr(scope, domain, source)
 
     def build_domain_to_model_expr(self, scope: ScopeASTBuilder, domain: TypeInfo, source: AttrASTBuilder) -> Expr:
-        return scope.call(self.__ref).kwarg(
-            "payload",
-            self.__mapper.build_domain_to_dto_expr(scope, domain, source),
+        return self.__mapper.build_dto_construct_expr(
+            scope,
+            self.info,
+            {"payload": self.__mapper.build_domain_to_dto_expr(scope, domain, source)},
         )
 
+    def build_load_json_expr(self, scope: ScopeASTBuilder, source: Expr) -> Expr:
+        return self.__mapper.mode("json").build_dto_decode_expr(scope, self.info, source)
+
     def build_dump_json_expr(self, scope: ScopeASTBuilder, source: Expr) -> Expr:
         return self.__mapper.mode("json").build_dto_encode_expr(scope, self.info, source)
 
-    def build_dump_serializable_expr(self, scope: ScopeASTBuilder, source: Expr) -> Expr:
-        return self.__mapper.mode("serializable").build_dto_encode_expr(scope, self.info, source)
-
 
 class FastAPIModelRegistry:
     def __init__(self, mapper: PydanticDtoMapper) -> None:
@@ -177,7 +175,7 @@ class FastAPIModelRegistry:
         method: MethodInfo,
         suffix: str,
     ) -> str:
-        return "".join(snake2camel(s) for s in (entrypoint.name, method.name, suffix))
+        return f"{snake2camel(entrypoint.name)}{snake2camel(method.name)}{snake2camel(suffix)}"
 
 
 class FastAPICodeGenerator(CodeGenerator):
@@ -256,14 +254,26 @@ class FastAPICodeGenerator(CodeGenerator):
                     for method in entrypoint.methods:
                         self.__build_server_handler_method(handler_def, registry, entrypoint, method)
 
-                self.__build_server_entrypoint_router(server, entrypoint, handler_def)
+                self.__build_server_entrypoint_router(server, registry, entrypoint, handler_def)
 
-    def __build_server_router_method(self, scope: ScopeASTBuilder, method: MethodInfo) -> None:
+    def __build_server_router_method(
+        self,
+        scope: ScopeASTBuilder,
+        registry: FastAPIModelRegistry,
+        entrypoint: EntrypointInfo,
+        method: MethodInfo,
+    ) -> None:
         if isinstance(method, UnaryUnaryMethodInfo):
+            response_model = registry.get_response(entrypoint, method)
+
             scope.stmt(
                 scope.attr("router", "post")
                 .call()
                 .kwarg("path", scope.const(f"/{method.name}"))
+                .kwarg(
+                    "response_model",
+                    scope.type_ref(response_model.info) if response_model is not None else scope.none(),
+                )
                 .kwarg("description", scope.const(method.doc) if method.doc is not None else scope.none())
                 .call()
                 .arg(scope.attr("handler", method.name)),
@@ -310,7 +320,7 @@ class FastAPICodeGenerator(CodeGenerator):
         with (
             scope.method_def(method.name)
             .arg("request", request_model)
-            .returns(response_model if response_model is not None else scope.none())
+            .returns(self.__fastapi_response if response_model is not None else scope.none())
             .async_(is_async=method.is_async) as method_def
         ):
             input_params = {f"input_{param.name}": param for param in method.params}
@@ -335,7 +345,11 @@ class FastAPICodeGenerator(CodeGenerator):
                     "response",
                     response_model.build_domain_to_model_expr(method_def, method.returns, scope.attr("output")),
                 )
-                scope.return_stmt(scope.attr("response"))
+                scope.return_stmt(
+                    scope.call(self.__fastapi_response)
+                    .kwarg("content", response_model.build_dump_json_expr(scope, scope.attr("response")))
+                    .kwarg("media_type", scope.const("application/json")),
+                )
 
             else:
                 scope.stmt(impl_call)
@@ -373,10 +387,10 @@ class FastAPICodeGenerator(CodeGenerator):
                 .returns(scope.iterator_type(method.input_.type_, is_async=True))
                 .async_()
             ):
-                with scope.for_stmt("request_text", scope.attr("websocket", "iter_text").call()).async_().body():
+                with scope.for_stmt("request_bytes", scope.attr("websocket", "iter_bytes").call()).async_().body():
                     scope.assign_stmt(
                         target="request",
-                        value=request_model.build_load_json_expr(scope, scope.attr("request_text")),
+                        value=request_model.build_load_json_expr(scope, scope.attr("request_bytes")),
                     )
                     scope.yield_stmt(
                         request_model.build_model_to_domain_expr(
@@ -409,7 +423,7 @@ class FastAPICodeGenerator(CodeGenerator):
                             ),
                         )
                         scope.stmt(
-                            scope.attr("websocket", "send_text")
+                            scope.attr("websocket", "send_bytes")
                             .call()
                             .arg(response_model.build_dump_json_expr(scope, scope.attr("response")))
                             .await_(),
@@ -421,6 +435,7 @@ class FastAPICodeGenerator(CodeGenerator):
     def __build_server_entrypoint_router(
         self,
         scope: ModuleASTBuilder,
+        registry: FastAPIModelRegistry,
         entrypoint: EntrypointInfo,
         handler_def: TypeRef,
     ) -> None:
@@ -439,7 +454,7 @@ class FastAPICodeGenerator(CodeGenerator):
             )
 
             for method in entrypoint.methods:
-                self.__build_server_router_method(scope, method)
+                self.__build_server_router_method(scope, registry, entrypoint, method)
 
             scope.return_stmt(scope.attr("router"))
 
@@ -450,21 +465,53 @@ class FastAPICodeGenerator(CodeGenerator):
         registry: FastAPIModelRegistry,
     ) -> None:
         with pkg.module("client") as client:
+            if any(
+                isinstance(method, UnaryUnaryMethodInfo)
+                for entrypoint in context.entrypoints
+                for method in entrypoint.methods
+            ):
+                client.assign_stmt(
+                    target="_JSON_HEADERS",
+                    value=client.dict_expr({client.const("Content-Type"): client.const("application/json")}),
+                )
+
             for entrypoint in context.entrypoints:
                 with client.class_def(f"{snake2camel(entrypoint.name)}Client") as client_class:
-                    with client_class.init_self_attrs_def({"impl": NamedTypeInfo.build("httpx", "Client")}):
-                        pass
+                    self.__build_client_init(client_class, registry, entrypoint, NamedTypeInfo.build("httpx", "Client"))
 
                     for method in entrypoint.methods:
                         self.__build_client_method(client_class, registry, entrypoint, method, is_async=False)
 
                 with client.class_def(f"{snake2camel(entrypoint.name)}AsyncClient") as async_client_class:
-                    with async_client_class.init_self_attrs_def({"impl": NamedTypeInfo.build("httpx", "AsyncClient")}):
-                        pass
+                    self.__build_client_init(
+                        async_client_class,
+                        registry,
+                        entrypoint,
+                        NamedTypeInfo.build("httpx", "AsyncClient"),
+                    )
 
                     for method in entrypoint.methods:
                         self.__build_client_method(async_client_class, registry, entrypoint, method, is_async=True)
 
+    def __build_client_init(
+        self,
+        scope: ClassScopeASTBuilder,
+        registry: FastAPIModelRegistry,
+        entrypoint: EntrypointInfo,
+        impl: TypeInfo,
+    ) -> None:
+        with scope.init_def().arg("impl", impl) as init_def:
+            init_def.assign_stmt(
+                target=init_def.self_attr("impl"),
+                value=init_def.attr("impl"),
+            )
+
+            if any(isinstance(method, UnaryUnaryMethodInfo) for method in entrypoint.methods):
+                init_def.assign_stmt(
+                    target=init_def.self_attr("post"),
+                    value=init_def.attr("impl", "post"),
+                )
+
     def __build_client_method(
         self,
         scope: ClassScopeASTBuilder,
@@ -502,10 +549,11 @@ class FastAPICodeGenerator(CodeGenerator):
             .async_(is_async=is_async) as method_def
         ):
             request_call_expr = (
-                method_def.self_attr("impl", "post")
+                method_def.self_attr("post")
                 .call()
                 .kwarg("url", scope.const(f"/{camel2snake(entrypoint.name)}/{method.name}"))
-                .kwarg("json", request_model.build_dump_serializable_expr(scope, scope.attr("request")))
+                .kwarg("content", request_model.build_dump_json_expr(scope, scope.attr("request")))
+                .kwarg("headers", scope.attr("_JSON_HEADERS"))
                 .await_(is_awaited=is_async)
             )
 
@@ -513,7 +561,7 @@ class FastAPICodeGenerator(CodeGenerator):
                 scope.assign_stmt("raw_response", request_call_expr)
                 scope.assign_stmt(
                     target="response",
-                    value=response_model.build_load_json_expr(scope, scope.attr("raw_response", "read").call()),
+                    value=response_model.build_load_json_expr(scope, scope.attr("raw_response", "content")),
                 )
                 scope.return_stmt(scope.attr("response"))
 
@@ -567,7 +615,7 @@ class FastAPICodeGenerator(CodeGenerator):
                 with try_receive_once.body():
                     with scope.for_stmt("request", scope.attr("requests")).async_().body():
                         scope.stmt(
-                            scope.attr("ws", "send_text")
+                            scope.attr("ws", "send_bytes")
                             .call()
                             .arg(request_model.build_dump_json_expr(scope, scope.attr("request")))
                             .await_(),
@@ -596,7 +644,7 @@ class FastAPICodeGenerator(CodeGenerator):
                             with try_receive_once.body():
                                 scope.assign_stmt(
                                     target="raw_response",
-                                    value=scope.attr("ws", "receive_text")
+                                    value=scope.attr("ws", "receive_bytes")
                                     .call()
                                     .kwarg("timeout", scope.attr("receive_timeout"))
                                     .await_(),
@@ -631,12 +679,11 @@ class FastAPICodeGenerator(CodeGenerator):
         scope.assign_stmt("done", scope.attr("threading", "Event").call())
 
         with scope.func_def("send_requests").arg("ws", self.__ws_sync_session).returns(scope.none()):
-            scope.stmt(scope.attr("done", "clear").call())
             with scope.try_stmt() as try_stmt:
                 with try_stmt.body():
                     with scope.for_stmt("request", scope.attr("requests")).body():
                         scope.stmt(
-                            scope.attr("ws", "send_text")
+                            scope.attr("ws", "send_bytes")
                             .call()
                             .arg(request_model.build_dump_json_expr(scope, scope.attr("request")))
                         )
@@ -664,7 +711,7 @@ class FastAPICodeGenerator(CodeGenerator):
                     with try_stmt.body():
                         scope.assign_stmt(
                             target="raw_response",
-                            value=scope.attr("ws", "receive_text")
+                            value=scope.attr("ws", "receive_bytes")
                             .call()
                             .kwarg("timeout", scope.attr("receive_timeout")),
                         )
@@ -685,6 +732,10 @@ class FastAPICodeGenerator(CodeGenerator):
                         )
                         scope.yield_stmt(scope.attr("response"))
 
+    @cached_property
+    def __fastapi_response(self) -> TypeInfo:
+        return NamedTypeInfo.build("fastapi", "Response")
+
     @cached_property
     def __threading_thread(self) -> TypeInfo:
         return NamedTypeInfo.build("threading", "Thread")
@@ -29,6 +29,7 @@ class ParameterInfo(Visitable):
     name: str
     type_: TypeInfo
     default: Option[object] = field(default_factory=Option[object].empty)
+    is_positional: bool = True
 
     @override
     def accept(self, visitor: Visitor) -> None:
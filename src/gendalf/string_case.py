@@ -3,10 +3,14 @@ import typing as t
 from functools import cache
 
 
+# NOTE: `cache` uses `typing.Any`
+@cache  # type: ignore[misc]
 def camel2snake(value: str) -> str:
     return _get_camel2snake_pattern().sub(_replace_underscore_group1_lower, value).lower()
 
 
+# NOTE: `cache` uses `typing.Any`
+@cache  # type: ignore[misc]
 def snake2camel(value: str) -> str:
     return _get_snake2camel_pattern().sub(_replace_group1_title, value)
 
@@ -10,7 +10,14 @@ from aiohttp.test_utils import TestServer, unused_port
 from fastapi import FastAPI
 from uvicorn import Config, Server
 
-from examples.my_greeter.client import run_client_aiohttp, run_client_httpx_async, run_client_httpx_sync
+from examples.my_greeter.client import (
+    make_aiohttp_session,
+    make_httpx_async_client,
+    make_httpx_client,
+    run_client_aiohttp,
+    run_client_httpx_async,
+    run_client_httpx_sync,
+)
 from examples.my_greeter.server import create_aiohttp, create_fastapi
 from gendalf._typing import ParamSpec
 
@@ -30,6 +37,12 @@ class ClientRunner(t.Protocol):
         raise NotImplementedError
 
 
+class UserFinder(t.Protocol):
+    @abc.abstractmethod
+    async def __call__(self, *, host: str, port: int, name: str) -> object:
+        raise NotImplementedError
+
+
 async def test_server_client_can_communicate(
     server_runner: ServerRunner,
     client_runner: ClientRunner,
@@ -40,6 +53,18 @@ async def test_server_client_can_communicate(
         await client_runner(host=server_host, port=server_port)
 
 
+async def test_server_client_can_communicate_none_payload(
+    server_runner: ServerRunner,
+    user_finder: UserFinder,
+    server_host: str,
+    server_port: int,
+) -> None:
+    async with server_runner(host=server_host, port=server_port):
+        found = await user_finder(host=server_host, port=server_port, name="unknown")
+
+    assert found is None
+
+
 @pytest.fixture
 def server_host() -> str:
     return "localhost"
@@ -79,6 +104,48 @@ def client_runner(request: SubRequest) -> ClientRunner:
         raise ValueError(msg, request.param)
 
 
+@pytest.fixture(params=["httpx", "httpx-async", "aiohttp"])
+def user_finder(request: SubRequest) -> UserFinder:
+    if request.param == "httpx":
+        return sync2async(find_user_httpx_sync)
+
+    elif request.param == "httpx-async":
+        return find_user_httpx_async
+
+    elif request.param == "aiohttp":
+        return find_user_aiohttp
+
+    else:
+        msg = "unknown client kind"
+        raise ValueError(msg, request.param)
+
+
+def find_user_httpx_sync(host: str, port: int, name: str) -> object:
+    from api.fastapi.client import UsersClient
+    from api.fastapi.model import UsersFindByNameRequest
+
+    with make_httpx_client(host, port) as client:
+        return UsersClient(client).find_by_name(UsersFindByNameRequest(name=name)).payload
+
+
+async def find_user_httpx_async(host: str, port: int, name: str) -> object:
+    from api.fastapi.client import UsersAsyncClient
+    from api.fastapi.model import UsersFindByNameRequest
+
+    async with make_httpx_async_client(host, port) as client:
+        response = await UsersAsyncClient(client).find_by_name(UsersFindByNameRequest(name=name))
+        return response.payload
+
+
+async def find_user_aiohttp(host: str, port: int, name: str) -> object:
+    from api.aiohttp.client import UsersClient
+    from api.aiohttp.model import UsersFindByNameRequest
+
+    async with make_aiohttp_session(host, port) as session:
+        response = await UsersClient(session).find_by_name(UsersFindByNameRequest(name=name))
+        return response.payload
+
+
 def sync2async(func: t.Callable[P, V_co]) -> t.Callable[P, t.Coroutine[t.Any, t.Any, V_co]]:
     @wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> V_co:  # type: ignore[misc]